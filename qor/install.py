@@ -32,7 +32,6 @@ def _copy_entry(src: Path, dst: Path, dry_run: bool) -> None:
     if dry_run:
         print(f"  [dry-run] {src} -> {dst}")
         return
-    dst.parent.mkdir(parents=True, exist_ok=True)
     shutil.copy2(src, dst)
 
 
@@ -55,13 +54,20 @@ def _resolve_install_source(host: str, dist_root: Path | None) -> tuple[Path, di
 def _copy_manifest_entries(
     manifest: dict, source_root: Path, install_map: dict[str, Path], dry_run: bool,
 ) -> list[dict]:
-    installed: list[dict] = []
+    pending: list[tuple[Path, Path, dict]] = []
     for entry in manifest["files"]:
         rel = entry["install_rel_path"]
         src = source_root / rel
         dst = _resolve_dest(rel, install_map)
         if not src.exists() or dst is None:
             continue
+        pending.append((src, dst, entry))
+    if not dry_run:
+        # One mkdir per destination directory, not one per copied file.
+        for parent in dict.fromkeys(dst.parent for _, dst, _ in pending):
+            parent.mkdir(parents=True, exist_ok=True)
+    installed: list[dict] = []
+    for src, dst, entry in pending:
         _copy_entry(src, dst, dry_run)
         if not dry_run:
             installed.append({"path": str(dst), "sha256": entry["sha256"]})
@@ -70,10 +70,18 @@ _LIST_KEY_RE = re.compile(
     r"|\n(?P<block>(?:\s+-\s+\S+\n?)+))",
     re.MULTILINE,
 )
-_BASH_FENCE_RE = re.compile(r"```(?:bash|shell|sh)\b", re.IGNORECASE)
-_AGENT_INVOCATION_RE = re.compile(
-    r"Agent\s*\(\s*(?:[^)]*?,\s*)?subagent_type\s*=\s*[\"']([^\"']+)[\"']",
-    re.MULTILINE,
+# Single pass over the skill body for every invocation signal:
+#   tool  -- ``Tool: <name>`` for each non-Bash canonical tool
+#   bash  -- a ```bash / ```shell / ```sh fence (Bash is detected this way)
+#   agent -- ``Agent(..., subagent_type="<name>")``
+# The tool and agent branches capture inside a lookahead and consume only
+# their leading literal, so one signal never hides another that overlaps it.
+_BODY_SCAN_RE = re.compile(
+    r"\bTool:\s*(?=(?P<tool>"
+    + "|".join(sorted((t for t in _CANONICAL_TOOLS if t != "Bash"), key=len, reverse=True))
+    + r")\b)"
+    r"|(?P<bash>```(?i:bash|shell|sh)\b)"
+    r"|(?=Agent\s*\(\s*(?:[^)]*?,\s*)?subagent_type\s*=\s*[\"'](?P<agent>[^\"']+)[\"'])Agent"
 )
 
 
@@ -94,25 +102,24 @@ def _parse_list_keys(frontmatter: str) -> dict[str, list[str]]:
     return out
 
 
-def _detect_tool_invocations(body: str) -> set[str]:
-    """Detect canonical Tool invocations in skill prose."""
-    found: set[str] = set()
-    if _BASH_FENCE_RE.search(body):
-        found.add("Bash")
-    for tool in _CANONICAL_TOOLS:
-        if tool == "Bash":
-            continue
-        if re.search(rf"\bTool:\s*{tool}\b", body):
-            found.add(tool)
-    return found
-
-
-def _detect_subagent_invocations(body: str) -> set[str]:
-    return {m.group(1) for m in _AGENT_INVOCATION_RE.finditer(body)}
+def _scan_body(body: str) -> tuple[set[str], set[str]]:
+    """Return (tool invocations, subagent invocations) found in skill prose."""
+    tools: set[str] = set()
+    subagents: set[str] = set()
+    for m in _BODY_SCAN_RE.finditer(body):
+        if m.group("tool"):
+            tools.add(m.group("tool"))
+        elif m.group("bash"):
+            tools.add("Bash")
+        else:
+            subagents.add(m.group("agent"))
+    return tools, subagents
 
 
 def compute_skill_admission_attributes(
     skill_md_path: str | Path,
+    *,
+    text: str | None = None,
 ) -> dict[str, bool]:
     """Phase 55: compute admission attributes for a Skill resource.
 
@@ -120,15 +127,18 @@ def compute_skill_admission_attributes(
     actual_subagent_invocations_exceed_scope}``.
     Skills missing the permitted_tools / permitted_subagents declarations are
     treated as the empty allowlist (default-deny posture per AI RMF GV-6.1).
+    Callers that already hold the skill text pass it as ``text`` to skip the
+    re-read.
     """
-    path = Path(skill_md_path)
-    if not path.exists():
-        return {
-            "registered": False, "has_frontmatter": False,
-            "actual_tool_invocations_exceed_scope": True,
-            "actual_subagent_invocations_exceed_scope": True,
-        }
-    text = path.read_text(encoding="utf-8")
+    if text is None:
+        path = Path(skill_md_path)
+        if not path.exists():
+            return {
+                "registered": False, "has_frontmatter": False,
+                "actual_tool_invocations_exceed_scope": True,
+                "actual_subagent_invocations_exceed_scope": True,
+            }
+        text = path.read_text(encoding="utf-8")
     fm_match = _FRONTMATTER_RE.match(text)
     has_frontmatter = fm_match is not None
     frontmatter = fm_match.group(1) if has_frontmatter else ""
@@ -138,8 +148,7 @@ def compute_skill_admission_attributes(
     declared_tools = set(keys.get("permitted_tools", []))
     declared_subagents = set(keys.get("permitted_subagents", []))
 
-    actual_tools = _detect_tool_invocations(body)
-    actual_subagents = _detect_subagent_invocations(body)
+    actual_tools, actual_subagents = _scan_body(body)
 
     return {
         "registered": True,
@@ -12,6 +12,7 @@ writing gate artifacts at all (per /qor-debug Phase 1 root cause).
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import sys
 from dataclasses import dataclass, field
@@ -22,6 +23,7 @@ REQUIRED_PHASES = ("plan", "audit", "implement", "substantiate")
 SEAL_HEADER_RE = re.compile(r"^### Entry #(\d+):\s*SESSION SEAL", re.MULTILINE)
 SESSION_LINE_RE = re.compile(r"^\*\*Session\*\*:\s*`?([0-9a-zA-Z._-]+)`?", re.MULTILINE)
 PHASE_NUM_RE = re.compile(r"Phase\s+(\d+)", re.IGNORECASE)
+_NEXT_HEADER_RE = re.compile(r"^### ", re.MULTILINE)
 
 
 @dataclass(frozen=True)
@@ -37,8 +39,8 @@ def _extract_seal_sessions(text: str, phase_min: int) -> dict[int, str]:
     for match in SEAL_HEADER_RE.finditer(text):
         body_start = match.end()
         # Body extends until next "^### " or EOF; cap at 2000 chars for parse efficiency
-        next_header = re.search(r"^### ", text[body_start:], re.MULTILINE)
-        body_end = body_start + (next_header.start() if next_header else 2000)
+        next_header = _NEXT_HEADER_RE.search(text, body_start)
+        body_end = next_header.start() if next_header else body_start + 2000
         body = text[body_start:body_end]
         phase_match = PHASE_NUM_RE.search(body[:300])
         sess_match = SESSION_LINE_RE.search(body)
@@ -49,6 +51,15 @@ def _extract_seal_sessions(text: str, phase_min: int) -> dict[int, str]:
     return out
 
 
+def _present_artifacts(sess_dir: Path) -> set[str]:
+    """Names of regular files in a session gate dir: one listing, not a stat per phase."""
+    try:
+        with os.scandir(sess_dir) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def check(
     repo_root: Path,
     *,
@@ -69,10 +80,9 @@ def check(
     by_phase = _extract_seal_sessions(text, phase_min)
     missing: list[tuple[int, str]] = []
     for phase_num, sid in sorted(by_phase.items()):
-        sess_dir = gates / sid
+        present = _present_artifacts(gates / sid)
         for required in REQUIRED_PHASES:
-            artifact = sess_dir / f"{required}.json"
-            if not artifact.is_file():
+            if f"{required}.json" not in present:
                 missing.append((phase_num, f"{sid}/{required}.json"))
     return CompletenessResult(
         ok=not missing,
@@ -45,6 +45,16 @@ def _head_commit(repo: Path) -> str:
     return result.stdout.strip()
 
 
+_VERDICT_PASS_RE = re.compile(
+    r"^\**(?:Verdict|VERDICT)\**\s*[:\-]\s*\**PASS\**\s*$", re.MULTILINE
+)
+
+
+def _verdict_is_pass(body: str) -> bool:
+    """Return True if ``body`` carries a canonical PASS verdict line."""
+    return _VERDICT_PASS_RE.search(body) is not None
+
+
 def _audit_has_pass(audit_path: Path) -> bool:
     """Return True if the audit file declares a canonical PASS verdict line.
 
@@ -53,14 +63,7 @@ def _audit_has_pass(audit_path: Path) -> bool:
     occurrences of "PASS" inside narrative prose ("If the test does not PASS,
     then ...") that the prior loose regex incorrectly admitted.
     """
-    body = audit_path.read_text(encoding="utf-8", errors="replace")
-    return bool(
-        re.search(
-            r"^\**(?:Verdict|VERDICT)\**\s*[:\-]\s*\**PASS\**\s*$",
-            body,
-            re.MULTILINE,
-        )
-    )
+    return _verdict_is_pass(audit_path.read_text(encoding="utf-8", errors="replace"))
 
 
 def _fingerprint_path(repo: Path, session: str) -> Path:
@@ -78,7 +81,9 @@ def capture(args: argparse.Namespace) -> int:
     if not audit.is_file():
         print(f"ERROR: audit not found: {audit}", file=sys.stderr)
         return 1
-    if not _audit_has_pass(audit):
+    # One read serves both the verdict check and the fingerprint hash.
+    audit_bytes = audit.read_bytes()
+    if not _verdict_is_pass(audit_bytes.decode("utf-8", errors="replace")):
         print("ERROR: audit not PASS", file=sys.stderr)
         return 1
 
@@ -87,7 +92,7 @@ def capture(args: argparse.Namespace) -> int:
         "plan_path": str(plan),
         "plan_hash": _hash_file(plan),
         "audit_path": str(audit),
-        "audit_hash": _hash_file(audit),
+        "audit_hash": _sha256_bytes(audit_bytes),
         "head_commit": _head_commit(repo),
         "captured_ts": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
     }
@@ -81,18 +81,22 @@ def check_admission(name: str, skills: dict[str, Path]) -> tuple[bool, str]:
     # Phase 55: Cedar tool/subagent scope enforcement (LLM07 + AI RMF GV-6.1).
     # Skips if the skill is not in the eight-skill scoped set (skills without
     # permitted_tools/permitted_subagents frontmatter are advisory-only).
-    scope_check = check_tool_scope(name, skills[name])
+    scope_check = check_tool_scope(name, skills[name], body=body)
     if not scope_check[0]:
         return False, scope_check[1]
 
     return True, f"ADMITTED: {name}"
 
 
-def check_tool_scope(name: str, skill_path: Path) -> tuple[bool, str]:
+def check_tool_scope(
+    name: str, skill_path: Path, body: str | None = None,
+) -> tuple[bool, str]:
     """Phase 55: enforce permitted_tools/permitted_subagents via Cedar.
 
     Skips skills that don't declare the frontmatter keys (Phase 54 advisory-only
     posture; Phase 55 admission only enforces declared scope, not absence).
+    ``body`` is the already-read skill text when the caller has it; the file is
+    read at most once and advisory-only skills skip the attribute scan.
 
     Gracefully degrades when invoked via direct file-path (legacy callsites
     where ``qor.policy`` is not importable): skips scope check.
@@ -102,11 +106,13 @@ def check_tool_scope(name: str, skill_path: Path) -> tuple[bool, str]:
     except ImportError:
         return True, ""  # legacy file-path invocation; skip Phase 55 enforcement
 
-    attrs = compute_skill_admission_attributes(skill_path)
-    body = skill_path.read_text(encoding="utf-8", errors="replace")
+    if body is None:
+        body = skill_path.read_text(encoding="utf-8", errors="replace")
     if "permitted_tools:" not in body and "permitted_subagents:" not in body:
         return True, ""  # advisory-only; not in scoped set
 
+    attrs = compute_skill_admission_attributes(skill_path, text=body)
+
     if attrs["actual_tool_invocations_exceed_scope"]:
         return False, (
             f"NOT-ADMITTED: {name} reason=tool-scope-exceeded; "
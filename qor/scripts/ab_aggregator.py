@@ -32,24 +32,25 @@ def parse_trial(raw_response: str, defect_ids: list[int]) -> list[dict]:
     return [{"defect_id": did, "findings_categories": declared.get(did, [])} for did in defect_ids]
 
 
+_DECODER = json.JSONDecoder()
+
+
 def _extract_trials_object(raw: str) -> dict | None:
-    """Walk brace-balanced candidates; return the first parseable object with 'trials' key."""
-    starts = [i for i, ch in enumerate(raw) if ch == "{"]
-    for start in starts:
-        depth = 0
-        for end in range(start, len(raw)):
-            if raw[end] == "{":
-                depth += 1
-            elif raw[end] == "}":
-                depth -= 1
-                if depth == 0:
-                    try:
-                        candidate = json.loads(raw[start : end + 1])
-                    except json.JSONDecodeError:
-                        break
-                    if isinstance(candidate, dict) and "trials" in candidate:
-                        return candidate
-                    break
+    """Return the first object decodable at a ``{`` that carries a 'trials' key.
+
+    Decodes in place with ``raw_decode`` rather than brace-matching and
+    re-parsing a sliced copy of every candidate; braces inside JSON strings no
+    longer throw the candidate boundary off.
+    """
+    start = raw.find("{")
+    while start != -1:
+        try:
+            candidate, _ = _DECODER.raw_decode(raw, start)
+        except json.JSONDecodeError:
+            candidate = None
+        if isinstance(candidate, dict) and "trials" in candidate:
+            return candidate
+        start = raw.find("{", start + 1)
     return None
 
 
@@ -50,12 +50,24 @@ class _ProvenanceContext:
     version: str
 
 
+_SYSTEM_VERSION_CACHE: str | None = None
+
+
 def _read_system_version() -> str:
-    if not _PYPROJECT.exists():
-        return "unknown"
-    with _PYPROJECT.open("rb") as fh:
-        data = tomllib.load(fh)
-    return str(data.get("project", {}).get("version", "unknown"))
+    """Package version from pyproject.toml, parsed once per process.
+
+    The file is fixed for the life of a process, but every gate artifact
+    write builds a manifest; re-parsing TOML per artifact is wasted work.
+    """
+    global _SYSTEM_VERSION_CACHE
+    if _SYSTEM_VERSION_CACHE is None:
+        try:
+            with _PYPROJECT.open("rb") as fh:
+                data = tomllib.load(fh)
+        except FileNotFoundError:
+            data = {}
+        _SYSTEM_VERSION_CACHE = str(data.get("project", {}).get("version", "unknown"))
+    return _SYSTEM_VERSION_CACHE
 
 
 def _detect_host() -> str:
@@ -31,17 +31,19 @@ def history_path(session_id: str) -> Path:
     return _workdir.gate_dir() / session_id / _HISTORY_FILENAME
 
 
-def append(payload: dict, session_id: str) -> Path:
+def append(payload: dict, session_id: str, *, validated: bool = False) -> Path:
     """Validate and append one audit gate payload to the session history log.
 
     Payload must conform to ``audit.schema.json``. The function enforces
     ``phase == "audit"`` and ``session_id`` matching the argument. Returns the
-    history path.
+    history path. ``validated=True`` skips the schema pass when the caller has
+    just validated the identical record (``gate_chain.write_gate_artifact``).
     """
     record = dict(payload)
     record.setdefault("phase", "audit")
     record.setdefault("session_id", session_id)
-    _vga._validate_data("audit", record)
+    if not validated:
+        _vga._validate_data("audit", record)
 
     path = history_path(session_id)
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -58,11 +60,13 @@ def read(session_id: str) -> list[dict]:
     the offending line number on malformed JSON or schema failure.
     """
     path = history_path(session_id)
-    if not path.is_file():
+    try:
+        fh = path.open("r", encoding="utf-8")
+    except (FileNotFoundError, IsADirectoryError):
         return []
 
     records: list[dict] = []
-    with path.open("r", encoding="utf-8") as fh:
+    with fh:
         for line_num, raw in enumerate(fh, start=1):
             line = raw.strip()
             if not line:
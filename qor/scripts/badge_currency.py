@@ -17,6 +17,7 @@ _BADGE_RE = re.compile(
     r"badge/(Tests|Ledger|Skills|Agents|Doctrines)-(\d+)",
     re.IGNORECASE,
 )
+_LEDGER_ENTRY_HEADER = "### Entry #"
 
 
 def count_tests(repo_root: Path) -> int:
@@ -56,7 +57,12 @@ def count_tests(repo_root: Path) -> int:
 def count_ledger_entries(ledger_path: Path) -> int:
     """Count `### Entry #` headers in META_LEDGER.md."""
     text = ledger_path.read_text(encoding="utf-8")
-    return len(re.findall(r"^### Entry #", text, re.MULTILINE))
+    # Scalar substring count (same as ``^### Entry #`` under MULTILINE) instead
+    # of materializing every regex match into a list just to take its length.
+    return (
+        text.count("\n" + _LEDGER_ENTRY_HEADER)
+        + text.startswith(_LEDGER_ENTRY_HEADER)
+    )
 
 
 def count_skills(repo_root: Path) -> int:
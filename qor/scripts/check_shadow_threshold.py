@@ -54,20 +54,25 @@ def sweep(events: list[dict], now: datetime) -> tuple[list[dict], list[dict], in
         if e["event_type"] == ESCALATION_EVENT and e.get("source_entry_id")
     }
 
+    # Schema pins ts to fixed-width "%Y-%m-%dT%H:%M:%SZ", so lexical order is
+    # chronological: compare against one precomputed cutoff instead of parsing
+    # every event timestamp. Only aged events are parsed (for age_days).
+    now_str = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    cutoff = (now - timedelta(days=STALE_DAYS)).astimezone(timezone.utc)
+    cutoff_str = cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
+
     new_escalations: list[dict] = []
     for e in events:
-        if e["addressed"]:
+        if e["addressed"] or e["ts"] > cutoff_str:
             continue
         age = now - parse_ts(e["ts"])
-        if age.days < STALE_DAYS:
-            continue
         if e["severity"] in (1, 2):
             e["addressed"] = True
-            e["addressed_ts"] = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+            e["addressed_ts"] = now_str
             e["addressed_reason"] = "stale"
         elif e["severity"] >= 3 and e["id"] not in existing_escalations:
             new_event = {
-                "ts": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "ts": now_str,
                 "skill": "qor-shadow-process",
                 "session_id": "escalation-sweep",
                 "event_type": ESCALATION_EVENT,
@@ -123,33 +128,48 @@ def main() -> int:
     args = ap.parse_args()
 
     single_file = args.log is not None
-    if single_file:
-        events = shadow_process.read_events(args.log)
+    now = parse_ts(args.now) if args.now else datetime.now(timezone.utc)
+    outcome: dict = {"count": 0, "escalations": 0, "sum": 0, "unaddr_ids": []}
+
+    def _apply(events: list[dict]) -> list[str]:
+        """Sweep ``events`` in place, appending escalations; return changed ids."""
+        was_addressed = {e["id"] for e in events if e["addressed"]}
+        _, new_escalations, sum_unaddr = sweep(events, now)
+        outcome.update(count=len(events), escalations=len(new_escalations), sum=sum_unaddr)
+        events.extend(new_escalations)
+        outcome["unaddr_ids"] = [e["id"] for e in events if not e["addressed"]]
+        changed = [e["id"] for e in events if e["addressed"] and e["id"] not in was_addressed]
+        return changed + [esc["id"] for esc in new_escalations]
+
+    def _apply_all(events: list[dict], src_map: dict[str, Path]) -> list[str]:
+        changed = _apply(events)
+        for e in events:
+            # Escalations are infrastructure-generated, hence UPSTREAM.
+            src_map.setdefault(e["id"], shadow_process.UPSTREAM_LOG_PATH)
+        return changed
+
+    # Writes hold the sidecar lock(s) from read to rewrite so concurrent
+    # appends are not lost between the sweep and the write.
+    if args.dry_run:
+        if single_file:
+            events = shadow_process.read_events(args.log)
+        else:
+            events = shadow_process.read_all_events()
+        changed = _apply(events)
+    elif single_file:
+        changed = shadow_process.update_events(args.log, lambda events: len(_apply(events)))
     else:
-        events = shadow_process.read_all_events()
-    if not events:
+        changed = shadow_process.update_all_events(_apply_all)
+
+    if not outcome["count"]:
         print("No events in log; nothing to check.")
         remove_marker()
         return 0
+    if changed and not args.dry_run:
+        print(f"Sweep wrote {outcome['escalations']} new escalation(s) and stale-expired events.")
 
-    now = parse_ts(args.now) if args.now else datetime.now(timezone.utc)
-    updated, new_escalations, sum_unaddr = sweep(events, now)
-
-    unaddr_ids = [e["id"] for e in (updated + new_escalations) if not e["addressed"]]
-
-    if not args.dry_run:
-        if new_escalations or any(e.get("addressed_reason") == "stale" for e in updated):
-            if single_file:
-                shadow_process.write_events(updated + new_escalations, args.log)
-            else:
-                src_map = shadow_process.id_source_map()
-                for esc in new_escalations:
-                    src_map[esc["id"]] = shadow_process.UPSTREAM_LOG_PATH
-                shadow_process.write_events_per_source(
-                    updated + new_escalations, src_map,
-                )
-            print(f"Sweep wrote {len(new_escalations)} new escalation(s) and stale-expired events.")
-
+    sum_unaddr = outcome["sum"]
+    unaddr_ids = outcome["unaddr_ids"]
     if sum_unaddr >= THRESHOLD:
         print(f"BREACH: severity sum {sum_unaddr} >= threshold {THRESHOLD}")
         print(f"  {len(unaddr_ids)} unaddressed event(s)")
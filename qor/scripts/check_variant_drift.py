@@ -22,20 +22,24 @@ COMMITTED_DIST = Path(str(_resources.asset("dist")))
 _DRIFT_EXCLUDE = {"manifest.json"}
 
 
-def hash_tree(root: Path) -> dict[str, str]:
-    """Map of relative-path -> sha256. Deterministic snapshot of a directory tree."""
-    out: dict[str, str] = {}
+def hash_tree(root: Path) -> dict[str, bytes]:
+    """Map of relative-path -> raw sha256 digest. Deterministic snapshot of a tree.
+
+    Digests are only compared in memory, never printed, so they stay as bytes
+    (no hex encoding per file).
+    """
+    out: dict[str, bytes] = {}
     if not root.exists():
         return out
     for p in sorted(root.rglob("*")):
         if p.is_file() and p.name not in _DRIFT_EXCLUDE:
             rel = p.relative_to(root).as_posix()
-            h = hashlib.sha256(p.read_bytes()).hexdigest()
-            out[rel] = h
+            with open(p, "rb") as fh:
+                out[rel] = hashlib.file_digest(fh, "sha256").digest()
     return out
 
 
-def compare(committed: dict[str, str], regenerated: dict[str, str]) -> list[str]:
+def compare(committed: dict[str, bytes], regenerated: dict[str, bytes]) -> list[str]:
     diffs: list[str] = []
     all_paths = set(committed) | set(regenerated)
     for p in sorted(all_paths):
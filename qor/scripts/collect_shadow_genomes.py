@@ -21,6 +21,7 @@ import subprocess
 import sys
 from collections import defaultdict
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -37,22 +38,36 @@ CHECK_SCRIPT = [sys.executable, "-m", "qor.scripts.check_shadow_threshold"]
 ISSUE_SCRIPT = [sys.executable, "-m", "qor.scripts.create_shadow_issue"]
 UPSTREAM_LOG_REL = "docs/PROCESS_SHADOW_GENOME_UPSTREAM.md"
 LEGACY_LOG_REL = "docs/PROCESS_SHADOW_GENOME.md"
+MAX_SWEEP_WORKERS = 8
 
 
 def validate_repo_path(path: Path) -> bool:
     """Validate repo path contains qor/ or docs/ directory marker."""
     return (path / "qor").is_dir() or (path / "docs").is_dir()
 
+
+_SCHEMA_CACHE: dict | None = None
+
+
+def _load_schema() -> dict:
+    global _SCHEMA_CACHE
+    if _SCHEMA_CACHE is None:
+        _SCHEMA_CACHE = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    return _SCHEMA_CACHE
+
+
 def load_config(path: Path | None = None) -> dict:
     """Load config from $QOR_CONFIG, explicit path, or ~/.qor/repos.json."""
     if path is None:
         env_path = os.environ.get("QOR_CONFIG")
         path = Path(env_path) if env_path else DEFAULT_CONFIG
-    if not path.exists():
-        raise FileNotFoundError(f"Config not found: {path}")
-    data = json.loads(path.read_text(encoding="utf-8"))
-    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
-    jsonschema.validate(data, schema)
+    # Read directly: a missing file surfaces from the open itself, no exists() probe.
+    try:
+        raw = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config not found: {path}") from None
+    data = json.loads(raw)
+    jsonschema.validate(data, _load_schema())
     return data
 
 def read_repo_shadow(repo_path: Path) -> list[dict]:
@@ -100,11 +115,29 @@ def sweep_one(repo: dict) -> list[dict]:
 
 
 def sweep_all(config: dict) -> list[dict]:
-    """Iterate enabled repos; return pooled unaddressed events."""
-    pooled: list[dict] = []
-    for repo in config["repos"]:
-        pooled.extend(sweep_one(repo))
-    return pooled
+    """Iterate enabled repos; return pooled unaddressed events.
+
+    Distinct repos share no state (each check runs in its own subprocess and
+    cwd), so they are swept concurrently. Entries naming the same path would
+    race on one genome and escalate the same aged events twice, so those run
+    one after another in a single worker. Results are pooled in config order.
+    """
+    repos = config["repos"]
+    by_path: dict[Path, list[int]] = defaultdict(list)
+    for i, repo in enumerate(repos):
+        by_path[Path(repo["path"]).resolve()].append(i)
+    if len(by_path) <= 1:
+        return [e for repo in repos for e in sweep_one(repo)]
+
+    per_repo: list[list[dict]] = [[] for _ in repos]
+
+    def _sweep_same_path(indices: list[int]) -> None:
+        for i in indices:
+            per_repo[i] = sweep_one(repos[i])
+
+    with ThreadPoolExecutor(max_workers=min(len(by_path), MAX_SWEEP_WORKERS)) as ex:
+        list(ex.map(_sweep_same_path, by_path.values()))
+    return [e for events in per_repo for e in events]
 
 
 def build_issue_body(events: list[dict], threshold: int) -> str:
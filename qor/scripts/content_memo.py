@@ -0,0 +1,39 @@
+"""Bounded per-process memo for text scanners.
+
+``secret_scanner`` and ``prompt_injection_canaries`` return results that
+depend only on the scanned text, and the same governance docs are re-scanned
+across audit, substantiate and self-tests. Both key their results on a
+BLAKE2b digest of the content through ``memoized``; each keeps its own cache
+dict so the two result types never mix.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+MAX_ENTRIES = 1024
+
+
+def digest(content: str) -> bytes:
+    return hashlib.blake2b(
+        content.encode("utf-8", "surrogatepass"), digest_size=16,
+    ).digest()
+
+
+def memoized(
+    cache: dict[bytes, T],
+    content: str,
+    compute: Callable[[str], T],
+    max_entries: int = MAX_ENTRIES,
+) -> T:
+    """Return ``compute(content)``, cached in ``cache``; oldest entry evicted at cap."""
+    key = digest(content)
+    result = cache.get(key)
+    if result is None:
+        result = compute(content)
+        if len(cache) >= max_entries:
+            del cache[next(iter(cache))]
+        cache[key] = result
+    return result
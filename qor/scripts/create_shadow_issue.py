@@ -127,13 +127,13 @@ def flip_events_only(log_path: Path, target_ids: set[str], url: str) -> int:
     Used by the cross-repo collector (Phase 5) to apply a single consolidated
     issue URL across multiple repos without each repo opening its own issue.
     """
-    all_events = shadow_process.read_events(log_path)
-    before = sum(1 for e in all_events if e["id"] in target_ids and not e["addressed"])
-    if before == 0:
-        return 0
-    updated = mark_addressed(all_events, target_ids, url)
-    shadow_process.write_events(updated, log_path)
-    return before
+    def _flip(all_events: list[dict]) -> int:
+        before = sum(1 for e in all_events if e["id"] in target_ids and not e["addressed"])
+        if before:
+            mark_addressed(all_events, target_ids, url)
+        return before
+
+    return shadow_process.update_events(log_path, _flip)
 
 
 def mark_resolved(log_path: Path, target_ids: set[str], reason: str = "remediated") -> int:
@@ -143,17 +143,18 @@ def mark_resolved(log_path: Path, target_ids: set[str], reason: str = "remediate
     no GitHub issue to attach. addressed_reason='remediated'; issue_url remains null.
     """
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    all_events = shadow_process.read_events(log_path)
-    flipped = 0
-    for e in all_events:
-        if e["id"] in target_ids and not e["addressed"]:
-            e["addressed"] = True
-            e["addressed_ts"] = now
-            e["addressed_reason"] = reason
-            flipped += 1
-    if flipped:
-        shadow_process.write_events(all_events, log_path)
-    return flipped
+
+    def _resolve(all_events: list[dict]) -> int:
+        flipped = 0
+        for e in all_events:
+            if e["id"] in target_ids and not e["addressed"]:
+                e["addressed"] = True
+                e["addressed_ts"] = now
+                e["addressed_reason"] = reason
+                flipped += 1
+        return flipped
+
+    return shadow_process.update_events(log_path, _resolve)
 
 
 def main() -> int:
@@ -224,12 +225,17 @@ def main() -> int:
     url = create_issue(args.repo, title, body)
     print(f"Issue created: {url}")
 
-    updated = mark_addressed(all_events, target_ids, url)
+    # Re-read under the sidecar lock(s): the issue round-trip above can take
+    # seconds, and events appended meanwhile must survive the rewrite.
     if single_file:
-        shadow_process.write_events(updated, log)
+        flip_events_only(log, target_ids, url)
     else:
-        src_map = shadow_process.id_source_map()
-        shadow_process.write_events_per_source(updated, src_map)
+        def _flip_all(events: list[dict], src_map: dict[str, Path]) -> list[str]:
+            flipped = [e["id"] for e in events if e["id"] in target_ids and not e["addressed"]]
+            mark_addressed(events, target_ids, url)
+            return flipped
+
+        shadow_process.update_all_events(_flip_all)
     print(f"Updated {len(target_ids)} event(s)")
 
     if MARKER_PATH.exists() and not args.events:
@@ -12,6 +12,7 @@ is known-clean.
 """
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
@@ -26,7 +27,7 @@ _STRICT_SCAN_ROOTS = (
 )
 _STRICT_SCAN_ROOT_FILES = ("CLAUDE.md", "CONTRIBUTING.md", "README.md", "CHANGELOG.md")
 _STRICT_EXCLUDE_SUFFIXES = (".py", ".json", ".toml", ".cedar")
-_STRICT_EXCLUDE_DIRS = ("vendor", "fixtures", "dist")
+_STRICT_EXCLUDE_DIRS = frozenset({"vendor", "fixtures", "dist"})
 
 
 def _iter_scan_files(repo_root: str):
@@ -35,16 +36,37 @@ def _iter_scan_files(repo_root: str):
         base = root / rel
         if not base.exists():
             continue
-        for p in base.rglob("*.md"):
-            if any(part in _STRICT_EXCLUDE_DIRS for part in p.parts):
-                continue
-            yield p
+        # Prune excluded directories during the walk so vendor/dist trees are
+        # never listed (rglob descended into them and filtered afterwards).
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = sorted(d for d in dirnames if d not in _STRICT_EXCLUDE_DIRS)
+            for name in sorted(filenames):
+                if name.endswith(".md"):
+                    yield Path(dirpath, name)
     for name in _STRICT_SCAN_ROOT_FILES:
         p = root / name
         if p.exists():
             yield p
 
 
+def _scan_corpus(repo_root: str) -> list[tuple[Path, str]]:
+    """(path, repo-relative posix path) for every in-scope file.
+
+    Materialized once per check call and shared by every glossary term,
+    instead of re-walking the scan roots once per term.
+    """
+    repo = Path(repo_root)
+    return [(f, f.relative_to(repo).as_posix()) for f in _iter_scan_files(repo_root)]
+
+
+def _cached_text(f: Path, cache: dict[Path, str]) -> str:
+    """Read ``f`` at most once per check call; later terms hit the cache."""
+    text = cache.get(f)
+    if text is None:
+        text = cache[f] = f.read_text(encoding="utf-8", errors="replace")
+    return text
+
+
 def check_term_drift(
     glossary_path: str,
     repo_root: str,
@@ -60,14 +82,14 @@ def check_term_drift(
     findings: list[str] = []
     repo = Path(repo_root)
     glossary_rel = Path(glossary_path).relative_to(repo).as_posix() if Path(glossary_path).is_absolute() else "qor/references/glossary.md"
+    corpus = _scan_corpus(repo_root)
+    texts: dict[Path, str] = {}
     for entry in entries:
         pattern = re.compile(r"\b" + re.escape(entry.term) + r"\b")
-        for f in _iter_scan_files(repo_root):
-            rel = f.relative_to(repo).as_posix()
+        for f, rel in corpus:
             if _excluded_by_scope_fence(entry, rel, glossary_rel):
                 continue
-            text = f.read_text(encoding="utf-8", errors="replace")
-            if pattern.search(text):
+            if pattern.search(_cached_text(f, texts)):
                 msg = f"Term '{entry.term}' used in {rel} not declared as referenced_by"
                 if strict:
                     raise ValueError(msg)
@@ -183,18 +205,18 @@ def check_cross_doc_conflicts(
     findings: list[str] = []
     repo = Path(repo_root)
     glossary_rel = Path(glossary_path).relative_to(repo).as_posix() if Path(glossary_path).is_absolute() else "qor/references/glossary.md"
+    corpus = _scan_corpus(repo_root)
+    texts: dict[Path, str] = {}
     for entry in entries:
         pattern = re.compile(
             _DEF_PATTERN_TMPL.format(term=re.escape(entry.term)),
             re.IGNORECASE,
         )
-        for f in _iter_scan_files(repo_root):
-            rel = f.relative_to(repo).as_posix()
+        for f, rel in corpus:
             # Phase 32: E shares D's scope fence (archives + home/peer exclusions)
             if _excluded_by_scope_fence(entry, rel, glossary_rel):
                 continue
-            text = f.read_text(encoding="utf-8", errors="replace")
-            for match in pattern.finditer(text):
+            for match in pattern.finditer(_cached_text(f, texts)):
                 found_def = match.group(1).strip()
                 canonical = entry.definition.strip()
                 if found_def.lower() not in canonical.lower() and canonical.lower() not in found_def.lower():
@@ -223,7 +223,7 @@ def write_gate_artifact(
     path = vga.write_artifact(phase, payload, session_id=sid)
     if phase == "audit":
         from qor.scripts import audit_history
-        audit_history.append(payload, session_id=sid)
+        audit_history.append(payload, session_id=sid, validated=True)
     _fire_gate_written_hook(phase, sid, path)
     return path
 
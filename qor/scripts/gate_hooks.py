@@ -31,6 +31,7 @@ import time
 import traceback
 from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import TextIO
 
 import yaml
 
@@ -41,6 +42,9 @@ ENTRY_POINT_GROUP = "qor_logic.events.gate_written"
 HOOK_TIMEOUT_SECONDS = 30
 
 _entry_point_cache: list["_HookTarget"] | None = None
+# hooks.yaml path -> ((st_mtime_ns, st_size), resolved targets). Re-parsed only
+# when the file changes, so repeated gate writes skip the YAML load + imports.
+_config_cache: dict[Path, tuple[tuple[int, int], list["_HookTarget"]]] = {}
 
 
 @dataclass(frozen=True)
@@ -62,9 +66,10 @@ class _HookTarget:
 
 
 def reload_entry_points() -> None:
-    """Invalidate the entry-point cache. Tests only — production never calls."""
+    """Invalidate the hook caches. Tests only — production never calls."""
     global _entry_point_cache
     _entry_point_cache = None
+    _config_cache.clear()
 
 
 def dispatch_gate_written(event: GateWrittenEvent) -> None:
@@ -76,8 +81,11 @@ def dispatch_gate_written(event: GateWrittenEvent) -> None:
     if not targets:
         return
     log_path = _workdir.root() / ".qor" / "hooks" / "hooks.log"
-    for target in targets:
-        _invoke_hook_safely(target, event, log_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    # One handle for the whole dispatch instead of mkdir + open/close per hook.
+    with log_path.open("a", encoding="utf-8") as log_fh:
+        for target in targets:
+            _invoke_hook_safely(target, event, log_fh)
 
 
 def _enumerate_entry_points() -> list[_HookTarget]:
@@ -95,14 +103,23 @@ def _enumerate_entry_points() -> list[_HookTarget]:
 
 def _load_config_file_hooks(root: Path) -> list[_HookTarget]:
     hooks_yaml = root / ".qor" / "hooks.yaml"
-    if not hooks_yaml.exists():
+    try:
+        st = hooks_yaml.stat()
+    except OSError:
+        _config_cache.pop(hooks_yaml, None)
         return []
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(hooks_yaml)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     try:
         data = yaml.safe_load(hooks_yaml.read_text(encoding="utf-8")) or {}
     except yaml.YAMLError:
-        return []
+        data = {}
     entries = data.get("gate_written") or []
-    return [t for t in (_resolve_config_entry(idx, e) for idx, e in enumerate(entries)) if t]
+    targets = [t for t in (_resolve_config_entry(idx, e) for idx, e in enumerate(entries)) if t]
+    _config_cache[hooks_yaml] = (stamp, targets)
+    return targets
 
 
 def _resolve_config_entry(idx: int, entry: dict) -> _HookTarget | None:
@@ -138,7 +155,7 @@ def _import_dotted(dotted: str):
 
 
 def _invoke_hook_safely(
-    target: _HookTarget, event: GateWrittenEvent, log_path: Path,
+    target: _HookTarget, event: GateWrittenEvent, log_fh: TextIO,
 ) -> None:
     """Invoke one hook; swallow Exception; let SIGINT/SystemExit propagate.
 
@@ -146,7 +163,7 @@ def _invoke_hook_safely(
     SG-BareExceptionSwallowsSignals-A. KeyboardInterrupt and SystemExit
     propagate so operators retain Ctrl-C control.
     """
-    start = time.monotonic()
+    start = time.monotonic_ns()
     status, exception = "ok", None
     try:
         if target.kind == "callable":
@@ -156,8 +173,8 @@ def _invoke_hook_safely(
     except Exception:
         status = "error"
         exception = traceback.format_exc()
-    duration_ms = int((time.monotonic() - start) * 1000)
-    _append_log(log_path, target.name, event, status, duration_ms, exception)
+    duration_ms = (time.monotonic_ns() - start) // 1_000_000
+    _append_log(log_fh, target.name, event, status, duration_ms, exception)
 
 
 def _run_command_hook(target: _HookTarget, event: GateWrittenEvent) -> None:
@@ -169,10 +186,9 @@ def _run_command_hook(target: _HookTarget, event: GateWrittenEvent) -> None:
 
 
 def _append_log(
-    log_path: Path, hook_name: str, event: GateWrittenEvent,
+    log_fh: TextIO, hook_name: str, event: GateWrittenEvent,
     status: str, duration_ms: int, exception: str | None,
 ) -> None:
-    log_path.parent.mkdir(parents=True, exist_ok=True)
     event_dict = asdict(event)
     event_dict["artifact_path"] = str(event.artifact_path)
     record = {
@@ -184,5 +200,6 @@ def _append_log(
     }
     if exception is not None:
         record["exception"] = exception
-    with log_path.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(record) + "\n")
+    log_fh.write(json.dumps(record) + "\n")
+    # Flush per record: a later hook may hang or be interrupted by Ctrl-C.
+    log_fh.flush()
@@ -4,23 +4,19 @@ Phase 32 Phase 1. Operator-facing check run ad-hoc via
 `python -m qor.scripts.install_drift_check --host claude --scope repo`
 or pre-phase via /qor-plan Step 0.2.
 
-Design: byte-identical SHA256 comparison between qor/skills/**/SKILL.md
-source and the installed counterpart under the host's skills_dir.
+Design: byte-identical comparison between qor/skills/**/SKILL.md source and
+the installed counterpart under the host's skills_dir. A size mismatch
+rejects a pair from ``stat`` alone; only same-size pairs are read, and those
+are compared directly rather than hashed.
 """
 from __future__ import annotations
 
 import argparse
-import hashlib
+import filecmp
 import sys
 from pathlib import Path
 
 
-def _sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    h.update(path.read_bytes())
-    return h.hexdigest()
-
-
 def _source_skills(repo_root: Path) -> list[Path]:
     return sorted((repo_root / "qor" / "skills").rglob("SKILL.md"))
 
@@ -51,7 +47,7 @@ def check(host: str = "claude", scope: str = "repo") -> list[str]:
         if not counterpart.exists():
             drift.append(f"missing install for {rel} (expected at {counterpart})")
             continue
-        if _sha256(source) != _sha256(counterpart):
+        if not filecmp.cmp(source, counterpart, shallow=False):
             drift.append(f"SHA256 mismatch: {rel} differs from {counterpart}")
     return drift
 
@@ -23,11 +23,8 @@ from pathlib import Path
 
 
 def content_hash(path: Path) -> str:
-    h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def chain_hash(content: str, prev: str) -> str:
@@ -41,26 +38,23 @@ def legacy_chain_hash(content: str, prev: str) -> str:
 
 
 def write_manifest(root: Path, include_globs: list[str], output: Path) -> dict:
-    """Walk root matching include_globs; emit manifest sorted by path."""
-    paths: list[dict[str, str]] = []
+    """Walk root matching include_globs; emit manifest sorted by path.
+
+    Paths matched by several globs are deduped before hashing, so each file
+    is read once however many globs cover it.
+    """
+    files: dict[str, Path] = {}
     for glob in include_globs:
         for p in sorted(root.glob(glob)):
             if p.is_file():
-                rel = p.relative_to(root).as_posix()
-                paths.append({"path": rel, "sha256": content_hash(p)})
+                files.setdefault(p.relative_to(root).as_posix(), p)
             elif p.is_dir():
                 for f in sorted(p.rglob("*")):
                     if f.is_file():
-                        rel = f.relative_to(root).as_posix()
-                        paths.append({"path": rel, "sha256": content_hash(f)})
-    # Dedupe preserving first occurrence
-    seen = set()
-    deduped = []
-    for item in paths:
-        if item["path"] not in seen:
-            seen.add(item["path"])
-            deduped.append(item)
-    deduped.sort(key=lambda x: x["path"])
+                        files.setdefault(f.relative_to(root).as_posix(), f)
+    deduped = [
+        {"path": rel, "sha256": content_hash(files[rel])} for rel in sorted(files)
+    ]
     manifest = {
         "schema_version": "1",
         "generated_ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -132,8 +126,8 @@ def verify(ledger_md: Path) -> int:
         previous_val = ph.group(1) or ph.group(2)
         recorded = xh.group(1) or xh.group(2)
         new_expected = chain_hash(content_val, previous_val)
-        old_expected = legacy_chain_hash(content_val, previous_val)
-        if new_expected == recorded or old_expected == recorded:
+        # Legacy (pre-Phase 23) form is only hashed when the current form misses.
+        if new_expected == recorded or legacy_chain_hash(content_val, previous_val) == recorded:
             print(f"OK   Entry #{num}: chain hash verified")
         else:
             print(
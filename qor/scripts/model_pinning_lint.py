@@ -23,6 +23,7 @@ from pathlib import Path
 
 # Canonical capability tier ordering. Lower index = lower capability.
 _CAPABILITY_ORDER: tuple[str, ...] = ("haiku", "sonnet", "opus")
+_CAPABILITY_RANK: dict[str, int] = {tier: i for i, tier in enumerate(_CAPABILITY_ORDER)}
 
 _FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
 _LIST_KEY_RE = re.compile(
@@ -83,8 +84,8 @@ def _check_one_skill(
         return None  # unknown model family; skip lint
 
     skill_name = skill_path.parent.name
-    if min_capability and min_capability in _CAPABILITY_ORDER:
-        if _CAPABILITY_ORDER.index(current_tier) < _CAPABILITY_ORDER.index(min_capability):
+    if min_capability and min_capability in _CAPABILITY_RANK:
+        if _CAPABILITY_RANK[current_tier] < _CAPABILITY_RANK[min_capability]:
             return ModelPinningWarning(
                 skill=skill_name, declared_min=min_capability,
                 declared_compatibility=compatibility, current_model=current_model,
@@ -43,11 +43,17 @@ def _count_session_overrides(session_id: str, *, log_path: Path | None = None) -
     path = log_path or _shadow_log_path()
     if not path.exists():
         return 0
+    # Substring probe ahead of the JSON parse: a line that does not contain the
+    # serialized session id cannot match, so most of the log is never decoded.
+    # Ids that JSON would escape skip the probe and fall back to full parsing.
+    probe = session_id if json.dumps(session_id) == f'"{session_id}"' else None
     count = 0
     for raw in path.read_text(encoding="utf-8").splitlines():
         line = raw.strip()
         if not line:
             continue
+        if probe is not None and (probe not in line or "gate_override" not in line):
+            continue
         try:
             event = json.loads(line)
         except json.JSONDecodeError:
@@ -26,11 +26,15 @@ class LintWarning:
     excerpt: str
 
 
+# The two-keyword patterns commit to the first keyword hit inside an atomic
+# group: a later hit can only see a suffix of what the first one saw, so
+# retrying it never changes the verdict. Without that, a long bullet
+# repeating the first keyword backtracks quadratically before failing.
 _PRESENCE_PATTERNS: tuple[tuple[str, re.Pattern], ...] = (
     ("substring-presence",
-     re.compile(r"asserts.*\bcontains\b.*\bliteral\b", re.IGNORECASE)),
+     re.compile(r"asserts(?>.*?\bcontains\b).*?\bliteral\b", re.IGNORECASE)),
     ("section-exists",
-     re.compile(r"asserts.*\bsection\b.*\b(?:exists?|present)\b", re.IGNORECASE)),
+     re.compile(r"asserts(?>.*?\bsection\b).*?\b(?:exists?|present)\b", re.IGNORECASE)),
     ("substring-in-file",
      re.compile(r"\bin\s+<file_text>|\bin\s+body\b|assert\s+\"[^\"]+\"\s+in\s+<", re.IGNORECASE)),
     ("path-exists",
@@ -26,6 +26,8 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+from qor.scripts import content_memo
+
 # Plan-path validation pattern. Restricted to docs/plan-qor-phase*.md plus
 # the four canonical governance files. No traversal segments admitted.
 _GOVERNANCE_FILE_RE = re.compile(
@@ -103,8 +105,26 @@ CANARIES: tuple[Canary, ...] = (
 )
 
 
-def scan(content: str) -> list[CanaryHit]:
-    """Return all canary hits in `content`, in ascending span order."""
+def _scoped(pattern: re.Pattern) -> str:
+    """Wrap `pattern` so its IGNORECASE flag survives inside an alternation."""
+    flags = "i" if pattern.flags & re.IGNORECASE else ""
+    return f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})"
+
+
+# Union of every canary. Clean content (the common case) is rejected in one
+# pass over the text instead of one pass per canary; per-canary finditer only
+# runs once the union has matched, so hit lists (including overlaps between
+# canaries) are unchanged.
+_ANY_CANARY_RE = re.compile("|".join(_scoped(c.pattern) for c in CANARIES))
+
+
+# Per-process memo of hits keyed on content (see ``content_memo``).
+_SCAN_CACHE: dict[bytes, tuple[CanaryHit, ...]] = {}
+
+
+def _scan_uncached(content: str) -> tuple[CanaryHit, ...]:
+    if not _ANY_CANARY_RE.search(content):
+        return ()
     hits: list[CanaryHit] = []
     for canary in CANARIES:
         for match in canary.pattern.finditer(content):
@@ -116,7 +136,12 @@ def scan(content: str) -> list[CanaryHit]:
                 )
             )
     hits.sort(key=lambda h: h.span[0])
-    return hits
+    return tuple(hits)
+
+
+def scan(content: str) -> list[CanaryHit]:
+    """Return all canary hits in `content`, in ascending span order."""
+    return list(content_memo.memoized(_SCAN_CACHE, content, _scan_uncached))
 
 
 def _validate_path(raw: str) -> Path:
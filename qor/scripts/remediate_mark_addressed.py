@@ -42,23 +42,25 @@ def _flip_event_fields(
     event_ids: list[str],
     fields: dict,
 ) -> tuple[int, list[str]]:
-    """Apply ``fields`` overlay to each matching unaddressed event; route write per source."""
-    events = shadow_process.read_all_events()
-    src_map = shadow_process.id_source_map()
-    target = set(event_ids)
-
-    flipped = 0
-    for event in events:
-        if event["id"] in target and not event["addressed"]:
-            event.update(fields)
-            flipped += 1
-
-    known_ids = set(src_map.keys())
-    missing_ids = [eid for eid in event_ids if eid not in known_ids]
+    """Apply ``fields`` overlay to each matching unaddressed event; route write per source.
 
-    if flipped:
-        shadow_process.write_events_per_source(events, src_map)
-    return flipped, missing_ids
+    Runs as one locked unit across both logs (``update_all_events``); the
+    logs are only locked once a matching event has been found.
+    """
+    target = set(event_ids)
+    missing_ids: list[str] = []
+
+    def _flip(events: list[dict], src_map: dict[str, Path]) -> list[str]:
+        missing_ids[:] = [eid for eid in event_ids if eid not in src_map]
+        flipped_ids: list[str] = []
+        for event in events:
+            if event["id"] in target and not event["addressed"]:
+                event.update(fields)
+                flipped_ids.append(event["id"])
+        return flipped_ids
+
+    flipped_ids = shadow_process.update_all_events(_flip)
+    return len(flipped_ids), missing_ids
 
 
 def mark_addressed_pending(
@@ -15,6 +15,8 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+from qor.scripts import content_memo
+
 
 @dataclass(frozen=True)
 class Pattern:
@@ -22,6 +24,12 @@ class Pattern:
     regex: re.Pattern[str]
     severity: int
     description: str
+    # Literals every match must contain; a text lacking all of them cannot
+    # match, so the regex is skipped (C-speed ``in`` instead of a regex pass).
+    anchors: tuple[str, ...] = ()
+
+    def may_match(self, text: str) -> bool:
+        return not self.anchors or any(a in text for a in self.anchors)
 
 
 @dataclass(frozen=True)
@@ -35,32 +43,32 @@ class Finding:
 
 PATTERNS: tuple[Pattern, ...] = (
     Pattern("aws-access-key", re.compile(r"AKIA[0-9A-Z]{16}"), 3,
-            "AWS access key ID"),
+            "AWS access key ID", ("AKIA",)),
     Pattern("github-pat-classic", re.compile(r"ghp_[A-Za-z0-9]{36}"), 3,
-            "GitHub personal access token (classic)"),
+            "GitHub personal access token (classic)", ("ghp_",)),
     Pattern("github-pat-finegrained",
             re.compile(r"github_pat_[A-Za-z0-9_]{82}"), 3,
-            "GitHub personal access token (fine-grained)"),
+            "GitHub personal access token (fine-grained)", ("github_pat_",)),
     Pattern("github-oauth", re.compile(r"gho_[A-Za-z0-9]{36}"), 3,
-            "GitHub OAuth access token"),
+            "GitHub OAuth access token", ("gho_",)),
     Pattern("private-key-header",
             re.compile(r"-----BEGIN (?:RSA |OPENSSH |EC |DSA )?PRIVATE KEY-----"),
-            3, "Private key PEM header"),
+            3, "Private key PEM header", ("PRIVATE KEY-----",)),
     Pattern("stripe-live", re.compile(r"sk_live_[A-Za-z0-9]{24,}"), 3,
-            "Stripe live secret key"),
+            "Stripe live secret key", ("sk_live_",)),
     Pattern("slack-token", re.compile(r"xox[baprs]-[A-Za-z0-9-]{10,}"), 3,
-            "Slack token"),
+            "Slack token", ("xox",)),
     Pattern("google-api-key", re.compile(r"AIza[A-Za-z0-9_\-]{35}"), 3,
-            "Google API key"),
+            "Google API key", ("AIza",)),
     Pattern("anthropic-key", re.compile(r"sk-ant-[A-Za-z0-9_\-]{90,}"), 3,
-            "Anthropic API key"),
+            "Anthropic API key", ("sk-ant-",)),
     Pattern("generic-high-entropy-assignment",
             re.compile(r'(?i)(?:secret|token|api_key|password|access_key)'
                        r'\w*\s*=\s*["\'][A-Za-z0-9/+=_\-]{20,}["\']'),
-            2, "Generic secret-like assignment"),
+            2, "Generic secret-like assignment", ("=",)),
     Pattern("private-key-url",
             re.compile(r"https?://[^:/\s]+:[^@\s]{8,}@"), 2,
-            "URL with embedded credentials"),
+            "URL with embedded credentials", ("://",)),
 )
 
 
@@ -106,43 +114,65 @@ def _redact(match: str) -> str:
     return f"{match[:4]}...{match[-2:]}"
 
 
-def _is_binary(path: Path) -> bool:
+_BINARY_SNIFF_BYTES = 8192
+
+
+def _read_text(path: Path) -> str | None:
+    """One read: NUL-sniff raw bytes, then decode like ``read_text``. None if binary."""
     try:
-        chunk = path.read_bytes()[:8192]
+        raw = path.read_bytes()
     except OSError:
-        return True
-    return b"\x00" in chunk
+        return None
+    if b"\x00" in raw[:_BINARY_SNIFF_BYTES]:
+        return None
+    content = raw.decode("utf-8", errors="replace")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 
 def _line_is_allowlisted(line: str) -> bool:
     return any(token in line for token in _ALLOWLIST)
 
 
-def scan_text(content: str, file: str = "<text>") -> list[Finding]:
-    findings: list[Finding] = []
+# Per-process memo of line-level hits (see ``content_memo``). Hits carry no
+# file label, so identical content under different paths shares one entry;
+# ``scan_text`` rebinds ``file`` on the way out.
+_SCAN_CACHE: dict[bytes, tuple[tuple[int, str, int, str], ...]] = {}
+_SCAN_CACHE_MAX = content_memo.MAX_ENTRIES
+
+
+def _scan_hits(content: str) -> tuple[tuple[int, str, int, str], ...]:
+    active = tuple(p for p in PATTERNS if p.may_match(content))
+    if not active:
+        return ()
+    hits: list[tuple[int, str, int, str]] = []
     for line_num, line in enumerate(content.splitlines(), start=1):
         if _line_is_allowlisted(line):
             continue
-        for pattern in PATTERNS:
+        for pattern in active:
+            if not pattern.may_match(line):
+                continue
             m = pattern.regex.search(line)
             if not m:
                 continue
-            findings.append(Finding(
-                file=file,
-                line=line_num,
-                pattern_name=pattern.name,
-                severity=pattern.severity,
-                matched_text_redacted=_redact(m.group(0)),
-            ))
-    return findings
+            hits.append((line_num, pattern.name, pattern.severity,
+                         _redact(m.group(0))))
+    return tuple(hits)
+
+
+def scan_text(content: str, file: str = "<text>") -> list[Finding]:
+    hits = content_memo.memoized(_SCAN_CACHE, content, _scan_hits, _SCAN_CACHE_MAX)
+    return [
+        Finding(file=file, line=line, pattern_name=name, severity=severity,
+                matched_text_redacted=redacted)
+        for line, name, severity, redacted in hits
+    ]
 
 
 def scan(path: Path, *, mask_blocks: bool | None = None) -> list[Finding]:
-    if _is_binary(path):
-        return []
-    try:
-        content = path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
+    content = _read_text(path)
+    if content is None:
         return []
     # Default behavior: mask code blocks for markdown sources (documentation
     # context where worked examples appear in fences/backticks). Pure source
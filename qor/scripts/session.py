@@ -35,13 +35,17 @@ def generate_id(now: datetime | None = None) -> str:
 
 
 def _atomic_write(path: Path, content: str) -> None:
+    """Write ``content`` to a temp file through the mkstemp fd, then rename into place."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(
-        mode="w", encoding="utf-8", dir=path.parent, delete=False, suffix=".tmp"
-    ) as tf:
-        tf.write(content)
-        tmp = tf.name
-    os.replace(tmp, path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        # fdopen's buffered write loops over short os.write counts.
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(content.encode("utf-8"))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
 
 
 def _marker_fresh(path: Path, now: datetime) -> bool:
@@ -77,8 +81,8 @@ def current(marker: Path | None = None, now: datetime | None = None) -> str | No
 def end_session(marker: Path | None = None) -> None:
     if marker is None:
         marker = MARKER_PATH
-    if marker.exists():
-        marker.unlink()
+    # No exists() probe: a concurrent end between check and unlink is a no-op.
+    marker.unlink(missing_ok=True)
 
 
 def rotate(now: datetime | None = None) -> str:
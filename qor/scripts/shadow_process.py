@@ -2,7 +2,7 @@
 """Shadow Process Genome append helper + reader.
 
 Validates events against qor/gates/schema/shadow_event.schema.json,
-computes deterministic ids, appends atomically.
+computes deterministic ids, appends under an exclusive sidecar lock.
 """
 from __future__ import annotations
 
@@ -11,9 +11,10 @@ import json
 import os
 import sys
 import tempfile
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Iterable, Literal
 
 import jsonschema
 
@@ -26,6 +27,12 @@ UPSTREAM_LOG_PATH = _workdir.shadow_log_upstream()
 LOG_PATH = LOCAL_LOG_PATH
 
 _SCHEMA_CACHE: dict | None = None
+_VALIDATOR_CACHE: jsonschema.protocols.Validator | None = None
+# json.dumps builds a fresh JSONEncoder whenever kwargs are passed; bind once.
+_encode_canonical = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+_encode_compact = json.JSONEncoder(separators=(",", ":")).encode
+# Same result as json.loads(str) minus its per-call type/BOM dispatch.
+_decode = json.JSONDecoder().decode
 
 
 def load_schema() -> dict:
@@ -43,14 +50,24 @@ def compute_id(event: dict) -> str:
         event["session_id"],
         event["event_type"],
         str(event["severity"]),
-        json.dumps(event.get("details", {}), sort_keys=True, separators=(",", ":")),
+        _encode_canonical(event.get("details", {})),
         event.get("source_entry_id") or "",
     ]
     return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
 
 
 def validate(event: dict) -> None:
-    jsonschema.validate(event, load_schema())
+    """Same contract as ``jsonschema.validate`` (raises the best-match error),
+    but the schema is checked and the validator built once per process."""
+    global _VALIDATOR_CACHE
+    if _VALIDATOR_CACHE is None:
+        schema = load_schema()
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        _VALIDATOR_CACHE = cls(schema)
+    error = jsonschema.exceptions.best_match(_VALIDATOR_CACHE.iter_errors(event))
+    if error is not None:
+        raise error
 
 
 def now_iso() -> str:
@@ -72,16 +89,33 @@ def append_event(
     log_path: Path | None = None,
 ) -> str:
     """Validate, id, append JSONL line. Returns computed id."""
+    return append_events([event], attribution=attribution, log_path=log_path)[0]
+
+
+def append_events(
+    events: list[dict],
+    *,
+    attribution: Literal["UPSTREAM", "LOCAL"] | None = None,
+    log_path: Path | None = None,
+) -> list[str]:
+    """Batch form of ``append_event``: one lock, one write. Returns ids in order.
+
+    Every event is validated before anything is written, so a bad event
+    rejects the whole batch rather than leaving a partial append.
+    """
     if log_path is None:
         if attribution is None:
-            raise ValueError("append_event requires attribution=... or log_path=...")
+            raise ValueError("attribution=... or log_path=... is required")
         log_path = log_path_for(attribution)
-    validate(event)
-    event_id = compute_id(event)
-    event_with_id = {"id": event_id, **event}
-    line = json.dumps(event_with_id, separators=(",", ":")) + "\n"
-    _atomic_append(log_path, line)
-    return event_id
+    for event in events:
+        validate(event)
+    ids = [compute_id(event) for event in events]
+    if ids:
+        _locked_append(log_path, "".join(
+            _encode_compact({"id": eid, **event}) + "\n"
+            for eid, event in zip(ids, events)
+        ))
+    return ids
 
 
 def _lock_file(fh):
@@ -104,39 +138,60 @@ def _unlock_file(fh):
         msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
 
 
-def _atomic_append(path: Path, line: str) -> None:
-    """Append a line atomically with file locking: read existing, write temp, os.replace."""
+@contextmanager
+def _exclusive_lock(path: Path):
+    """Hold the sidecar ``<log>.lock`` for the duration of a write.
+
+    Writers take the lock before reading so a read-modify-write cannot
+    interleave with a concurrent append; readers stay lock-free.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    lock_path = path.parent / (path.name + ".lock")
-    lock_path.touch(exist_ok=True)
-    with open(lock_path, "r") as lock_fh:
+    lock_path = path.with_name(path.name + ".lock")
+    # Mode "a" creates the sidecar on first use and opens it in one call.
+    with open(lock_path, "a") as lock_fh:
         _lock_file(lock_fh)
         try:
-            existing = path.read_text(encoding="utf-8") if path.exists() else ""
-            new_content = existing + (line if existing.endswith("\n") or not existing else "\n" + line)
-            with tempfile.NamedTemporaryFile(
-                mode="w", encoding="utf-8", dir=path.parent, delete=False, suffix=".tmp"
-            ) as tf:
-                tf.write(new_content)
-                tmp_path = tf.name
-            os.replace(tmp_path, path)
+            yield
         finally:
             _unlock_file(lock_fh)
 
 
+def _locked_append(path: Path, line: str) -> None:
+    """Append ``line`` (one or more JSONL lines) under the sidecar lock, in place.
+
+    Only the last byte is inspected (to repair a missing trailing newline), so
+    each append costs O(1) I/O instead of re-writing the whole log. The write
+    is not atomic: writers are serialized by the lock, but a lock-free reader
+    (``read_events``, the collector, the threshold sweep) racing an append,
+    or reading after a crash mid-append, can see a torn final line. It warns
+    about it as malformed and skips that event until the next read.
+    """
+    with _exclusive_lock(path):
+        prefix = ""
+        if path.exists() and path.stat().st_size:
+            with open(path, "rb") as fh:
+                fh.seek(-1, os.SEEK_END)
+                if fh.read(1) != b"\n":
+                    prefix = "\n"
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write(prefix + line)
+
+
 def read_events(log_path: Path | None = None) -> list[dict]:
     """Parse JSONL lines from log; skip markdown prose."""
     if log_path is None:
         log_path = LOG_PATH
-    if not log_path.exists():
+    try:
+        text = log_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return []
     events: list[dict] = []
-    for i, line in enumerate(log_path.read_text(encoding="utf-8").splitlines(), 1):
+    for i, line in enumerate(text.splitlines(), 1):
         line = line.strip()
         if not line.startswith("{"):
             continue
         try:
-            events.append(json.loads(line))
+            events.append(_decode(line))
         except json.JSONDecodeError:
             print(f"WARN: skipping malformed JSONL line {i}", file=sys.stderr)
             continue
@@ -150,8 +205,68 @@ def write_events(events: list[dict], log_path: Path | None = None) -> None:
     """
     if log_path is None:
         log_path = LOG_PATH
+    with _exclusive_lock(log_path):
+        _write_events_locked(events, log_path)
+
+
+def update_events(log_path: Path, mutate: Callable[[list[dict]], int]) -> int:
+    """Locked read-modify-write: ``mutate`` edits events in place, returns change count.
+
+    The lock is taken before the read so concurrent appends queue behind the
+    rewrite instead of being dropped by it. Nothing is written when
+    ``mutate`` reports zero changes.
+    """
+    with _exclusive_lock(log_path):
+        events = read_events(log_path)
+        changed = mutate(events)
+        if changed:
+            _write_events_locked(events, log_path)
+    return changed
+
+
+def update_all_events(
+    mutate: Callable[[list[dict], dict[str, Path]], Iterable[str]],
+) -> list[str]:
+    """Cross-log read-modify-write as one unit; returns the changed ids.
+
+    ``mutate`` edits events in place (registering new events in ``src_map``)
+    and returns the ids it changed. It first runs against a lock-free read;
+    only when that finds a change are both logs locked (even one that does
+    not exist yet, since ``mutate`` may register new events into it),
+    re-read and mutated again, so ``mutate`` must be safe to call twice.
+    Only logs holding changed ids are rewritten. If any rewrite fails, logs
+    already rewritten are restored before re-raising.
+    """
+    events, src_map = read_all_events_with_sources()
+    if not list(mutate(events, src_map)):
+        return []
+    with ExitStack() as stack:
+        for path in sorted({LOCAL_LOG_PATH, UPSTREAM_LOG_PATH}):
+            stack.enter_context(_exclusive_lock(path))
+        events, src_map = read_all_events_with_sources()
+        changed = list(mutate(events, src_map))
+        dirty = {src_map.get(i) for i in changed}
+        by_file: dict[Path, list[dict]] = {}
+        for e in events:
+            if src_map.get(e["id"]) in dirty:
+                by_file.setdefault(src_map[e["id"]], []).append(e)
+        originals: dict[Path, bytes | None] = {}
+        try:
+            for path, batch in by_file.items():
+                originals[path] = path.read_bytes() if path.exists() else None
+                _write_events_locked(batch, path)
+        except BaseException:
+            for path, data in originals.items():
+                if data is None:
+                    path.unlink(missing_ok=True)
+                else:
+                    _replace_bytes(path, data)
+            raise
+    return changed
+
+
+def _write_events_locked(events: list[dict], log_path: Path) -> None:
     if not log_path.exists():
-        log_path.parent.mkdir(parents=True, exist_ok=True)
         prose = ""
     else:
         lines = log_path.read_text(encoding="utf-8").splitlines()
@@ -160,37 +275,60 @@ def write_events(events: list[dict], log_path: Path | None = None) -> None:
         while prose_lines and not prose_lines[-1].strip():
             prose_lines.pop()
         prose = "\n".join(prose_lines) + "\n\n"
-    body = "\n".join(json.dumps(e, separators=(",", ":")) for e in events) + "\n"
-    content = prose + body
+    body = "\n".join(_encode_compact(e) for e in events) + "\n"
+    _replace_bytes(log_path, (prose + body).encode("utf-8"))
+
+
+def _replace_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to a sibling temp file, then swap it in with ``os.replace``."""
     with tempfile.NamedTemporaryFile(
-        mode="w", encoding="utf-8", dir=log_path.parent, delete=False, suffix=".tmp"
+        mode="wb", dir=path.parent, delete=False, suffix=".tmp"
     ) as tf:
-        tf.write(content)
+        tf.write(data)
         tmp_path = tf.name
-    os.replace(tmp_path, log_path)
+    os.replace(tmp_path, path)
 
 
 def read_all_events() -> list[dict]:
     return read_events(LOCAL_LOG_PATH) + read_events(UPSTREAM_LOG_PATH)
 
 
+def read_all_events_with_sources() -> tuple[list[dict], dict[str, Path]]:
+    """Single pass over both logs: (events, id -> source path).
+
+    Equivalent to ``read_all_events()`` + ``id_source_map()`` but parses each
+    log once, so read-modify-write callers don't re-read the genome.
+    """
+    events: list[dict] = []
+    src_map: dict[str, Path] = {}
+    for path in (LOCAL_LOG_PATH, UPSTREAM_LOG_PATH):
+        batch = read_events(path)
+        for e in batch:
+            src_map[e["id"]] = path
+        events.extend(batch)
+    return events, src_map
+
+
 def id_source_map() -> dict[str, Path]:
-    out: dict[str, Path] = {}
-    for e in read_events(LOCAL_LOG_PATH):
-        out[e["id"]] = LOCAL_LOG_PATH
-    for e in read_events(UPSTREAM_LOG_PATH):
-        out[e["id"]] = UPSTREAM_LOG_PATH
-    return out
+    return read_all_events_with_sources()[1]
 
 
 def write_events_per_source(
     events: list[dict],
     src_map: dict[str, Path],
+    changed_ids: Iterable[str] | None = None,
 ) -> None:
+    """Rewrite each source log with its events.
+
+    With ``changed_ids``, only logs holding at least one of those ids are
+    rewritten; untouched logs keep their bytes and skip a full rewrite.
+    """
     by_file: dict[Path, list[dict]] = {}
     for e in events:
         path = src_map.get(e["id"])
         if path is not None:
             by_file.setdefault(path, []).append(e)
+    dirty = None if changed_ids is None else {src_map.get(i) for i in changed_ids}
     for path, batch in by_file.items():
-        write_events(batch, path)
+        if dirty is None or path in dirty:
+            write_events(batch, path)
@@ -47,6 +47,11 @@ class ProgressEntry:
     sealed: bool
 
 
+# Phase 55: every "### Priority N ..." heading line, indexed once per brief so
+# per-priority bundle lookups are dict hits rather than a search per priority.
+_PRIORITY_HEADING_RE = re.compile(r"###\s+Priority\s+(\d+)\b[^\n]*")
+
+
 _DATE_SUFFIX_RE = re.compile(r"(\d{4}-\d{2}-\d{2})\.md$")
 
 
@@ -71,6 +76,14 @@ def parse_priorities(brief_path: Path) -> list[Priority]:
     ]
 
 
+def _index_priority_headings(content: str) -> dict[str, str]:
+    """Map each priority number (as written) to its first heading line."""
+    index: dict[str, str] = {}
+    for m in _PRIORITY_HEADING_RE.finditer(content):
+        index.setdefault(m.group(1), m.group(0))
+    return index
+
+
 def _bundled_phase_for_priority(content: str, priority_heading: str) -> int | None:
     """Phase 55: scan the body following a priority heading for "folded into Phase NN"."""
     idx = content.find(priority_heading)
@@ -139,6 +152,7 @@ def compute_progress(repo_root: Path) -> tuple[Path | None, list[ProgressEntry]]
     sealed = sealed_phases(ledger)
     sealed_priorities = sealed_priorities_from_ledger(ledger)
     content = brief.read_text(encoding="utf-8")
+    headings = _index_priority_headings(content)
 
     entries: list[ProgressEntry] = []
     for p in priorities:
@@ -148,13 +162,10 @@ def compute_progress(repo_root: Path) -> tuple[Path | None, list[ProgressEntry]]
         if p.number in sealed_priorities:
             entries.append(ProgressEntry(priority=p, sealed=True))
             continue
-        heading_match = re.search(
-            rf"###\s+Priority\s+{p.number}\b[^\n]*",
-            content,
-        )
+        heading = headings.get(str(p.number))
         bundled = (
-            _bundled_phase_for_priority(content, heading_match.group(0))
-            if heading_match else None
+            _bundled_phase_for_priority(content, heading)
+            if heading is not None else None
         )
         sealed_via_bundle = bundled is not None and bundled in sealed
         entries.append(ProgressEntry(priority=p, sealed=sealed_via_bundle))
@@ -30,12 +30,13 @@ def _list_break_artifacts(session_id: str) -> list[dict]:
     base = _workdir.gate_dir() / session_id
     breaks: list[dict] = []
     for kind in ("implement", "debug"):
-        path = base / f"{kind}.json"
-        if path.is_file():
-            payload = json.loads(path.read_text(encoding="utf-8"))
-            ts = payload.get("ts")
-            if ts:
-                breaks.append({"kind": kind, "ts": ts})
+        try:
+            raw = (base / f"{kind}.json").read_text(encoding="utf-8")
+        except (FileNotFoundError, IsADirectoryError):
+            continue
+        ts = json.loads(raw).get("ts")
+        if ts:
+            breaks.append({"kind": kind, "ts": ts})
     return breaks
 
 
@@ -14,6 +14,7 @@ from pathlib import Path
 
 import jsonschema
 import referencing
+import referencing.exceptions
 
 from qor.scripts import session
 
@@ -64,10 +65,32 @@ PHASES = [
 
 
 def load_schema(phase: str) -> dict:
+    """Parsed phase schema, shared with the ``$ref`` registry.
+
+    The registry already parses every schema file once per process; reading
+    the phase file again here would decode and parse the same bytes twice.
+    """
     path = SCHEMA_DIR / f"{phase}.schema.json"
-    if not path.exists():
-        raise SystemExit(f"ERROR: schema not found for phase '{phase}': {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    try:
+        return _registry().contents(path.name)
+    except referencing.exceptions.NoSuchResource:
+        raise SystemExit(f"ERROR: schema not found for phase '{phase}': {path}") from None
+
+
+_VALIDATORS: dict[str, jsonschema.Draft202012Validator] = {}
+
+
+def _validator(phase: str) -> jsonschema.Draft202012Validator:
+    """Per-phase validator, built once per process and reused across calls.
+
+    Saves re-reading + re-parsing the schema file and re-resolving ``$ref``s
+    for every artifact (``audit_history.read`` validates one record per line).
+    """
+    validator = _VALIDATORS.get(phase)
+    if validator is None:
+        validator = jsonschema.Draft202012Validator(load_schema(phase), registry=_registry())
+        _VALIDATORS[phase] = validator
+    return validator
 
 
 def validate_one(phase: str, artifact_path: Path) -> list[str]:
@@ -77,13 +100,7 @@ def validate_one(phase: str, artifact_path: Path) -> list[str]:
         data = json.loads(artifact_path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as e:
         return [f"invalid JSON: {e}"]
-    schema = load_schema(phase)
-    errors: list[str] = []
-    validator = jsonschema.Draft202012Validator(schema, registry=_registry())
-    for err in validator.iter_errors(data):
-        path_str = ".".join(str(p) for p in err.absolute_path) or "<root>"
-        errors.append(f"{path_str}: {err.message}")
-    return errors
+    return _validate_data(phase, data)
 
 
 def validate_all_current_session() -> tuple[int, int, list[str]]:
@@ -140,10 +157,8 @@ def write_artifact(phase: str, data: dict, session_id: str | None = None) -> Pat
 
 
 def _validate_data(phase: str, data: dict) -> list[str]:
-    schema = load_schema(phase)
     errors: list[str] = []
-    validator = jsonschema.Draft202012Validator(schema, registry=_registry())
-    for err in validator.iter_errors(data):
+    for err in _validator(phase).iter_errors(data):
         path_str = ".".join(str(p) for p in err.absolute_path) or "<root>"
         errors.append(f"{path_str}: {err.message}")
     return errors
@@ -35,34 +35,20 @@ SEED_TARGETS: tuple[SeedTarget, ...] = (
 )
 
 
-def _read_template(name: str) -> str:
+def _read_template(name: str) -> bytes:
     path = Path(str(_resources.asset("templates"))) / name
-    return path.read_text(encoding="utf-8")
-
-
-def _write_file_if_missing(dst: Path, content: str) -> bool:
-    if dst.exists():
-        return False
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    dst.write_text(content, encoding="utf-8")
-    return True
-
-
-def _write_gitkeep(dst: Path) -> bool:
-    if dst.exists():
-        return False
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    dst.write_text("", encoding="utf-8")
-    return True
+    return path.read_bytes()
 
 
 def _append_gitignore_section(dst: Path) -> bool:
-    existing = dst.read_text(encoding="utf-8") if dst.exists() else ""
+    try:
+        existing = dst.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        existing = ""
     if _GITIGNORE_MARKER in existing:
         return False
     sep = "" if existing == "" or existing.endswith("\n") else "\n"
     block = f"{sep}{_GITIGNORE_MARKER}\n{_GITIGNORE_BODY}{_GITIGNORE_END}\n"
-    dst.parent.mkdir(parents=True, exist_ok=True)
     with dst.open("a", encoding="utf-8") as fh:
         fh.write(block)
     return True
@@ -70,10 +56,23 @@ def _append_gitignore_section(dst: Path) -> bool:
 
 def _apply_target(base: Path, target: SeedTarget) -> bool:
     dst = base / target.rel_path
-    if target.mode == "file":
-        return _write_file_if_missing(dst, _read_template(target.template))
-    if target.mode == "gitkeep":
-        return _write_gitkeep(dst)
+    if target.mode in ("file", "gitkeep"):
+        # Exclusive create is the existence check: re-seeding an existing
+        # workspace costs one failed open per target, with no separate probe.
+        try:
+            fh = dst.open("xb")
+        except FileExistsError:
+            return False
+        # Templates are read only for targets that are actually missing and
+        # written as raw bytes (no text-mode newline translation).
+        try:
+            with fh:
+                if target.mode == "file":
+                    fh.write(_read_template(target.template))
+        except BaseException:
+            dst.unlink(missing_ok=True)
+            raise
+        return True
     if target.mode == "gitignore_append":
         return _append_gitignore_section(dst)
     raise ValueError(f"unknown seed mode: {target.mode!r}")
@@ -81,7 +80,9 @@ def _apply_target(base: Path, target: SeedTarget) -> bool:
 
 def seed(base: Path, *, quiet: bool = False) -> SeedResult:
     """Scaffold the governance workspace under ``base``. Idempotent."""
-    base.mkdir(parents=True, exist_ok=True)
+    # Each distinct parent directory (``base`` included) is created once.
+    for parent in sorted({(base / t.rel_path).parent for t in SEED_TARGETS}):
+        parent.mkdir(parents=True, exist_ok=True)
     created: list[str] = []
     skipped: list[str] = []
     for target in SEED_TARGETS:
@@ -52,6 +52,20 @@ def test_parse_trial_fills_missing_defect_ids():
     assert trials[2]["findings_categories"] == []
 
 
+def test_parse_trial_skips_non_trials_objects_and_braces_in_strings():
+    raw = (
+        '{"note": "not it"} then {"trials": [{"defect_id": 1, '
+        '"findings_categories": ["ghost-ui"], "why": "unbalanced { brace"}]}'
+    )
+    trials = ab_aggregator.parse_trial(raw, [1])
+    assert trials == [{"defect_id": 1, "findings_categories": ["ghost-ui"]}]
+
+
+def test_parse_trial_finds_trials_nested_in_wrapper_object():
+    raw = '{"wrapper": {"trials": [{"defect_id": 2, "findings_categories": ["x"]}]}}'
+    assert ab_aggregator.parse_trial(raw, [2])[0]["findings_categories"] == ["x"]
+
+
 # ===== aggregate =====
 
 def test_aggregate_groups_by_skill_and_variant():
@@ -41,6 +41,26 @@ def test_build_manifest_reads_system_version_from_pyproject():
     assert pyproject_version != "unknown", "pyproject.toml must declare version"
 
 
+def test_system_version_parsed_once_per_process(tmp_path, monkeypatch):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nversion = "1.2.3"\n', encoding="utf-8")
+    monkeypatch.setattr(ai_provenance, "_PYPROJECT", pyproject)
+    monkeypatch.setattr(ai_provenance, "_SYSTEM_VERSION_CACHE", None)
+    assert ai_provenance._read_system_version() == "1.2.3"
+    pyproject.unlink()
+    manifest = ai_provenance.build_manifest(
+        "implement", host="x", model_family="y",
+        human_oversight=HumanOversight.ABSENT,
+    )
+    assert manifest["version"] == "1.2.3"
+
+
+def test_system_version_unknown_without_pyproject(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_provenance, "_PYPROJECT", tmp_path / "missing.toml")
+    monkeypatch.setattr(ai_provenance, "_SYSTEM_VERSION_CACHE", None)
+    assert ai_provenance._read_system_version() == "unknown"
+
+
 @pytest.mark.parametrize("phase", ["audit", "substantiate", "validate"])
 def test_build_manifest_rejects_invalid_human_oversight_for_decision_phase(phase):
     with pytest.raises(ValueError, match="absent"):
@@ -67,6 +67,13 @@ def test_read_absent_history_returns_empty(tmp_path):
     assert records == []
 
 
+def test_read_skips_directory_at_history_path(tmp_path):
+    with mock.patch("qor.scripts.audit_history._workdir.gate_dir", return_value=tmp_path):
+        audit_history.history_path("s-dir").mkdir(parents=True)
+        records = audit_history.read("s-dir")
+    assert records == []
+
+
 def test_read_rejects_malformed_line_with_line_number(tmp_path):
     with mock.patch("qor.scripts.audit_history._workdir.gate_dir", return_value=tmp_path):
         path = audit_history.history_path("s-bad")
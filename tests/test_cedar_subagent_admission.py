@@ -1,6 +1,7 @@
 """Phase 55: Cedar admission rule end-to-end tests."""
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from qor.policy import Decision, EntityUID, Request, evaluate
@@ -10,7 +11,9 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 CEDAR_PATH = REPO_ROOT / "qor" / "policies" / "skill_admission.cedar"
 
 
+@functools.lru_cache(maxsize=1)
 def _load_policies():
+    # Parsed once per module: policies are frozen and evaluate() only reads them.
     return parse_policies(CEDAR_PATH.read_text(encoding="utf-8"))
 
 
@@ -98,3 +98,44 @@ def test_term_drift_declared_consumer_passes(tmp_path):
     )
     findings = dis.check_term_drift(glossary, root, strict=False)
     assert not findings, f"Declared consumer should not trigger drift: {findings}"
+
+
+def test_term_drift_reads_each_scan_file_once_across_terms(tmp_path, monkeypatch):
+    bar_entry = _FOO_ENTRY.replace("term: Foo", "term: Bar").replace("# Glossary\n\n", "")
+    glossary, root = _mk_repo(
+        tmp_path,
+        _FOO_ENTRY + "\n" + bar_entry,
+        {"docs/architecture.md": "# arch\nFoo and Bar live here.\n",
+         "qor/gates/other.md": "# other\nFoo and Bar are used here too.\n"},
+    )
+    reads: list[str] = []
+    real_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self.name)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    findings = dis.check_term_drift(glossary, root, strict=False)
+    assert sum("qor/gates/other.md" in f for f in findings) == 2
+    assert reads.count("other.md") == 1
+
+
+def test_scan_walk_prunes_excluded_dirs_without_listing_them(tmp_path, monkeypatch):
+    glossary, root = _mk_repo(
+        tmp_path,
+        _FOO_ENTRY,
+        {"qor/skills/a/SKILL.md": "Foo\n",
+         "qor/skills/vendor/pkg/README.md": "Foo\n",
+         "qor/gates/dist/x.md": "Foo\n"},
+    )
+    listed: list[str] = []
+    real_scandir = dis.os.scandir
+    monkeypatch.setattr(
+        dis.os, "scandir", lambda path: listed.append(Path(path).name) or real_scandir(path),
+    )
+    rels = [rel for _, rel in dis._scan_corpus(root)]
+    assert "qor/skills/a/SKILL.md" in rels
+    assert not any("vendor" in r or "/dist/" in r for r in rels)
+    assert "a" in listed
+    assert "vendor" not in listed and "dist" not in listed
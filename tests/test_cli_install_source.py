@@ -82,3 +82,34 @@ def test_dry_run_shows_variant_specific_source(tmp_path, capsys):
     assert "claude" not in captured or "variants/claude" not in captured.replace("\\", "/")
     # Nothing actually copied
     assert not (target / "skills" / "A" / "SKILL.md").exists()
+
+
+def test_install_creates_each_destination_dir_once(tmp_path, monkeypatch):
+    from qor.install import _copy_manifest_entries
+    src_root = tmp_path / "variant"
+    files = []
+    for rel in ("skills/A/SKILL.md", "skills/A/ref.md", "skills/B/SKILL.md"):
+        (src_root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (src_root / rel).write_text(rel, encoding="utf-8")
+        files.append({"install_rel_path": rel, "sha256": "x"})
+    target = tmp_path / "target"
+    target.mkdir()
+
+    made: list[Path] = []
+    real_mkdir = Path.mkdir
+
+    def _spy(self, *args, **kwargs):
+        made.append(self)
+        return real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", _spy)
+    installed = _copy_manifest_entries(
+        {"files": files}, src_root, {"skills/": target}, dry_run=False,
+    )
+    assert made == [target / "A", target / "B"]
+    assert [e["path"] for e in installed] == [
+        str(target / "A" / "SKILL.md"),
+        str(target / "A" / "ref.md"),
+        str(target / "B" / "SKILL.md"),
+    ]
+    assert (target / "A" / "ref.md").read_text(encoding="utf-8") == "skills/A/ref.md"
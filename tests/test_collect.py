@@ -70,10 +70,28 @@ def test_load_config_explicit_path(tmp_path):
 
 
 def test_load_config_raises_on_missing(tmp_path):
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match="Config not found"):
         collect.load_config(tmp_path / "nope.json")
 
 
+def test_load_config_parses_schema_once_per_process(tmp_path, monkeypatch):
+    config_path = tmp_path / "repos.json"
+    config_path.write_text(json.dumps(_valid_config([])), encoding="utf-8")
+    monkeypatch.setattr(collect, "_SCHEMA_CACHE", None)
+    schema_text = collect.SCHEMA_PATH.read_text(encoding="utf-8")
+    reads: list[str] = []
+
+    class _CountingSchemaPath:
+        def read_text(self, encoding):
+            reads.append(encoding)
+            return schema_text
+
+    monkeypatch.setattr(collect, "SCHEMA_PATH", _CountingSchemaPath())
+    for _ in range(3):
+        collect.load_config(config_path)
+    assert len(reads) == 1
+
+
 def test_config_schema_rejects_missing_required(tmp_path):
     config_path = tmp_path / "repos.json"
     # Missing "meta_repo"
@@ -161,6 +179,60 @@ def test_sweep_all_pools_multi_repo(tmp_path, monkeypatch):
     assert repos == {"a", "b"}
 
 
+def test_sweep_all_runs_repo_checks_concurrently_in_config_order(tmp_path, monkeypatch):
+    import threading
+    names = ["c", "a", "b"]
+    repos = [
+        _mk_fake_repo(tmp_path, n, [_mk_event(severity=1, session_id=n)])
+        for n in names
+    ]
+    # Every check blocks until all three are in flight: a serial sweep would
+    # time out on the barrier instead of pooling.
+    barrier = threading.Barrier(len(names), timeout=5)
+
+    def fake_run(cmd, *args, **kwargs):
+        barrier.wait()
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    config = _valid_config([
+        {"path": str(r), "name": n, "enabled": True} for r, n in zip(repos, names)
+    ])
+    pooled = collect.sweep_all(config)
+    assert [e["source_repo"] for e in pooled] == names
+
+
+def test_sweep_all_runs_same_path_entries_one_after_another(tmp_path, monkeypatch):
+    import threading
+    import time
+    shared = _mk_fake_repo(tmp_path, "shared", [_mk_event(severity=1, session_id="s")])
+    other = _mk_fake_repo(tmp_path, "other", [_mk_event(severity=1, session_id="o")])
+    lock = threading.Lock()
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    def fake_run(cmd, *args, cwd=None, **kwargs):
+        key = str(Path(cwd).resolve())
+        with lock:
+            in_flight[key] = in_flight.get(key, 0) + 1
+            peak[key] = max(peak.get(key, 0), in_flight[key])
+        time.sleep(0.05)
+        with lock:
+            in_flight[key] -= 1
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    config = _valid_config([
+        {"path": str(shared), "name": "first", "enabled": True},
+        {"path": str(other), "name": "other", "enabled": True},
+        # Same repo under a non-canonical spelling.
+        {"path": str(shared / "docs" / ".."), "name": "second", "enabled": True},
+    ])
+    pooled = collect.sweep_all(config)
+    assert peak[str(shared.resolve())] == 1
+    assert [e["source_repo"] for e in pooled] == ["first", "other", "second"]
+
+
 def test_threshold_trips_globally_not_per_repo(tmp_path, monkeypatch):
     # Two repos, each sev 5 => 10 pooled => trips.
     # Neither alone would trip (5 < 10).
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import shutil
+import sys
 from pathlib import Path
 
 import pytest
@@ -99,8 +100,7 @@ def test_drift_detector_clean_after_compile(fake_tree, monkeypatch):
     # Point drift at this dist
     monkeypatch.setattr(drift_mod, "COMMITTED_DIST", out)
     # Run main with default args
-    import sys as _s
-    _s.argv = ["drift", "--committed", str(out)]
+    monkeypatch.setattr(sys, "argv", ["drift", "--committed", str(out)])
     rc = drift_mod.main()
     assert rc == 0
 
@@ -113,8 +113,7 @@ def test_drift_detector_flags_manual_edit(fake_tree, monkeypatch, capsys):
     skill_md.write_text("# TAMPERED\n", encoding="utf-8")
 
     monkeypatch.setattr(drift_mod, "COMMITTED_DIST", out)
-    import sys as _s
-    _s.argv = ["drift", "--committed", str(out)]
+    monkeypatch.setattr(sys, "argv", ["drift", "--committed", str(out)])
     rc = drift_mod.main()
     assert rc == 1
     captured = capsys.readouterr()
@@ -129,14 +128,26 @@ def test_drift_detector_flags_stale_file(fake_tree, monkeypatch, capsys):
     extra.write_text("extra\n", encoding="utf-8")
 
     monkeypatch.setattr(drift_mod, "COMMITTED_DIST", out)
-    import sys as _s
-    _s.argv = ["drift", "--committed", str(out)]
+    monkeypatch.setattr(sys, "argv", ["drift", "--committed", str(out)])
     rc = drift_mod.main()
     assert rc == 1
     captured = capsys.readouterr()
     assert "only in committed" in captured.out  # extra-file.md is in committed but not regenerated
 
 
+def test_hash_tree_keeps_raw_digests(tmp_path):
+    import hashlib
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.md").write_bytes(b"alpha")
+    (tmp_path / "manifest.json").write_bytes(b"{}")
+    tree = drift_mod.hash_tree(tmp_path)
+    assert tree == {"sub/a.md": hashlib.sha256(b"alpha").digest()}
+    (tmp_path / "sub" / "a.md").write_bytes(b"beta")
+    assert drift_mod.compare(tree, drift_mod.hash_tree(tmp_path)) == [
+        "  ~ sub/a.md (content differs)",
+    ]
+
+
 def test_dry_run_does_not_write(fake_tree):
     out = fake_tree / "dist"
     summary = compile_mod.compile_all(out, dry_run=True)
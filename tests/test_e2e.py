@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -103,7 +104,7 @@ def test_full_chain_advisory_flow(isolated):
 
 # ----- E2E 2: Override path with shadow event + threshold -----
 
-def test_override_path_full_cycle(isolated):
+def test_override_path_full_cycle(isolated, monkeypatch):
     """Skip plan; audit overrides; event lands; threshold sees it."""
     sid = session.get_or_create()
 
@@ -123,8 +124,7 @@ def test_override_path_full_cycle(isolated):
     assert events[0]["details"]["prior_phase"] == "plan"
 
     # Threshold check sees the event but does not breach
-    import sys as _s
-    _s.argv = ["check", "--log", str(isolated.shadow_log)]
+    monkeypatch.setattr(sys, "argv", ["check", "--log", str(isolated.shadow_log)])
     rc = cst.main()
     assert rc == 0  # 1 < threshold 10
     assert not isolated.remediate_marker.exists()
@@ -153,7 +153,7 @@ def test_capability_shortfall_pipeline(isolated):
 
 # ----- E2E 4: Threshold breach writes marker -----
 
-def test_threshold_breach_writes_marker(isolated):
+def test_threshold_breach_writes_marker(isolated, monkeypatch):
     """Append events totaling sev >= 10; marker written with aggregated ids."""
     events = [
         _mk_event(severity=5, ts="2026-04-15T10:00:00Z", session_id="s-a"),
@@ -163,8 +163,7 @@ def test_threshold_breach_writes_marker(isolated):
         "\n".join(json.dumps(e) for e in events) + "\n", encoding="utf-8"
     )
 
-    import sys as _s
-    _s.argv = ["check", "--log", str(isolated.shadow_log), "--now", "2026-04-15T12:00:00Z"]
+    monkeypatch.setattr(sys, "argv", ["check", "--log", str(isolated.shadow_log), "--now", "2026-04-15T12:00:00Z"])
     rc = cst.main()
     assert rc == 10
 
@@ -177,14 +176,13 @@ def test_threshold_breach_writes_marker(isolated):
 
 # ----- E2E 5: Aged escalation idempotence (full cycle) -----
 
-def test_aged_high_severity_self_escalation_idempotent(isolated):
+def test_aged_high_severity_self_escalation_idempotent(isolated, monkeypatch):
     """Aged sev-3 -> escalation event (sev 5); 2nd sweep produces no duplicate."""
     aged = _mk_event(severity=3, ts="2026-01-01T00:00:00Z", session_id="s-old")
     isolated.shadow_log.write_text(json.dumps(aged) + "\n", encoding="utf-8")
 
-    import sys as _s
     # 1st sweep: now is well past 90 days from Jan 1
-    _s.argv = ["check", "--log", str(isolated.shadow_log), "--now", "2026-04-15T12:00:00Z"]
+    monkeypatch.setattr(sys, "argv", ["check", "--log", str(isolated.shadow_log), "--now", "2026-04-15T12:00:00Z"])
     cst.main()
 
     after_first = shadow_process.read_events()
@@ -194,7 +192,7 @@ def test_aged_high_severity_self_escalation_idempotent(isolated):
     assert escalations_1[0]["severity"] == 5
 
     # 2nd sweep: same args, no duplicate escalation
-    _s.argv = ["check", "--log", str(isolated.shadow_log), "--now", "2026-04-15T13:00:00Z"]
+    monkeypatch.setattr(sys, "argv", ["check", "--log", str(isolated.shadow_log), "--now", "2026-04-15T13:00:00Z"])
     cst.main()
 
     after_second = shadow_process.read_events()
@@ -263,8 +261,7 @@ def test_compile_drift_full_cycle(tmp_path, monkeypatch):
 
     # Drift after compile = 0
     monkeypatch.setattr(drift_mod, "COMMITTED_DIST", out)
-    import sys as _s
-    _s.argv = ["drift", "--committed", str(out)]
+    monkeypatch.setattr(sys, "argv", ["drift", "--committed", str(out)])
     assert drift_mod.main() == 0
 
     # Tamper dist
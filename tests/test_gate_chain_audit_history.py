@@ -34,6 +34,23 @@ def test_audit_write_updates_singleton_and_history(tmp_path):
     assert history_records[0]["verdict"] == "PASS"
 
 
+def test_audit_write_validates_payload_once(tmp_path):
+    from qor.scripts import validate_gate_artifact as vga
+    calls: list[str] = []
+    real_validate = vga._validate_data
+
+    def counting_validate(phase, data):
+        calls.append(phase)
+        return real_validate(phase, data)
+
+    with mock.patch("qor.scripts.validate_gate_artifact.GATES_DIR", tmp_path), \
+         mock.patch("qor.scripts.audit_history._workdir.gate_dir", return_value=tmp_path), \
+         mock.patch.object(vga, "_validate_data", counting_validate):
+        gate_chain.write_gate_artifact(phase="audit", payload=AUDIT_PAYLOAD, session_id="s-gc-hist")
+    assert calls == ["audit"]
+    assert (tmp_path / "s-gc-hist" / "audit_history.jsonl").exists()
+
+
 def test_non_audit_write_does_not_create_history(tmp_path):
     plan_payload = {
         "phase": "plan",
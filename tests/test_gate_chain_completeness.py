@@ -111,6 +111,25 @@ def test_check_skips_phases_below_phase_min(tmp_path):
     assert result.sessions_checked == []
 
 
+def test_check_multi_seal_ledger_counts_only_regular_files(tmp_path):
+    """Each seal body ends at the next header; a directory named like an artifact is missing."""
+    from qor.reliability.gate_chain_completeness import check
+
+    ledger = tmp_path / "META_LEDGER.md"
+    ledger.write_text(
+        _make_seal_entry(52, "s52") + "\n" + _make_seal_entry(53, "s53"),
+        encoding="utf-8",
+    )
+    gates = tmp_path / ".qor" / "gates"
+    _make_session_dir(gates, "s52", "plan", "audit", "implement", "substantiate")
+    _make_session_dir(gates, "s53", "plan", "implement", "substantiate")
+    (gates / "s53" / "audit.json").mkdir()
+
+    result = check(tmp_path, phase_min=52, ledger_path=ledger, gates_root=gates)
+    assert result.sessions_checked == ["s52", "s53"]
+    assert result.missing == [(53, "s53/audit.json")]
+
+
 def test_check_handles_missing_ledger_gracefully(tmp_path):
     """If META_LEDGER.md absent, check returns ok=False with descriptive message."""
     from qor.reliability.gate_chain_completeness import check
@@ -118,3 +118,31 @@ def test_yaml_parse_error_returns_empty_list(tmp_path):
 
     targets = gate_hooks._load_config_file_hooks(tmp_path)
     assert targets == []
+
+
+def test_config_hooks_parsed_once_until_file_changes(tmp_path, monkeypatch):
+    import os
+
+    loads: list = []
+    real_load = gate_hooks.yaml.safe_load
+    monkeypatch.setattr(gate_hooks.yaml, "safe_load",
+                        lambda text: loads.append(text) or real_load(text))
+    hooks_yaml = tmp_path / ".qor" / "hooks.yaml"
+    hooks_yaml.parent.mkdir()
+    hooks_yaml.write_text("gate_written:\n  - command: [echo, a]\n", encoding="utf-8")
+
+    first = gate_hooks._load_config_file_hooks(tmp_path)
+    assert gate_hooks._load_config_file_hooks(tmp_path) == first
+    assert len(loads) == 1
+
+    hooks_yaml.write_text(
+        "gate_written:\n  - command: [echo, a]\n  - command: [echo, b]\n",
+        encoding="utf-8",
+    )
+    st = hooks_yaml.stat()
+    os.utime(hooks_yaml, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert len(gate_hooks._load_config_file_hooks(tmp_path)) == 2
+    assert len(loads) == 2
+
+    hooks_yaml.unlink()
+    assert gate_hooks._load_config_file_hooks(tmp_path) == []
@@ -101,3 +101,23 @@ def test_dispatch_runs_entry_points_before_config_hooks(tmp_path, monkeypatch):
 
     gate_hooks.dispatch_gate_written(_event(tmp_path))
     assert order == ["entry-point", "config-file"]
+
+
+def test_dispatch_opens_hooks_log_once_for_all_targets(tmp_path, monkeypatch):
+    hooks = [SimpleNamespace(name=f"h{i}", load=lambda: (lambda event: None)) for i in range(3)]
+    monkeypatch.setattr(gate_hooks.importlib.metadata, "entry_points",
+                        lambda group=None: hooks)
+    log = tmp_path / ".qor" / "hooks" / "hooks.log"
+    opens: list[Path] = []
+    real_open = Path.open
+
+    def counting_open(self, *args, **kwargs):
+        if self == log:
+            opens.append(self)
+        return real_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", counting_open)
+    gate_hooks.dispatch_gate_written(_event(tmp_path))
+    assert len(opens) == 1
+    records = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    assert [r["hook"] for r in records] == ["h0", "h1", "h2"]
@@ -3,16 +3,14 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from qor.scripts import gate_hooks
-
+import pytest
 
-def test_missing_hooks_yaml_returns_empty_list(tmp_path: Path):
-    # No .qor/hooks.yaml created
-    targets = gate_hooks._load_config_file_hooks(tmp_path)
-    assert targets == []
+from qor.scripts import gate_hooks
 
 
-def test_missing_qor_dir_returns_empty_list(tmp_path: Path):
-    # Not even .qor directory
+@pytest.mark.parametrize("with_qor_dir", [True, False], ids=["no-hooks-yaml", "no-qor-dir"])
+def test_missing_hooks_config_returns_empty_list(tmp_path: Path, with_qor_dir: bool):
+    if with_qor_dir:
+        (tmp_path / ".qor").mkdir()
     targets = gate_hooks._load_config_file_hooks(tmp_path)
     assert targets == []
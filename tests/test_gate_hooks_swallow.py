@@ -48,6 +48,20 @@ def test_callable_hook_raising_exception_is_swallowed_and_logged(tmp_path, monke
     assert "boom" in record["exception"]
 
 
+def test_hook_duration_is_integer_ms_from_monotonic_ns(tmp_path, monkeypatch):
+    fake_ep = SimpleNamespace(name="ok-hook", load=lambda: lambda event: None)
+    monkeypatch.setattr(gate_hooks.importlib.metadata, "entry_points",
+                        lambda group=None: [fake_ep])
+    clock = iter([10_000_000, 12_999_999])
+    monkeypatch.setattr(gate_hooks.time, "monotonic_ns", lambda: next(clock))
+
+    gate_hooks.dispatch_gate_written(_event(tmp_path))
+
+    log = tmp_path / ".qor" / "hooks" / "hooks.log"
+    record = json.loads(log.read_text().strip())
+    assert record["duration_ms"] == 2
+
+
 def test_subprocess_hook_with_nonzero_exit_is_logged_with_status_ok(tmp_path, monkeypatch):
     """Subprocess BLOCK is the consumer's responsibility; non-zero exits don't error the dispatch."""
     monkeypatch.setattr(gate_hooks.importlib.metadata, "entry_points",
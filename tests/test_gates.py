@@ -70,6 +70,26 @@ def test_end_session_removes_marker(tmp_path, monkeypatch):
     assert not marker.exists()
 
 
+def test_end_session_tolerates_already_removed_marker(tmp_path):
+    marker = tmp_path / "current_session"
+    session.get_or_create(marker)
+    session.end_session(marker)
+    session.end_session(marker)
+    assert not marker.exists()
+
+
+def test_marker_write_failure_leaves_no_temp_file(tmp_path, monkeypatch):
+    marker = tmp_path / "session" / "current"
+
+    def boom(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(session.os, "replace", boom)
+    with pytest.raises(OSError):
+        session.get_or_create(marker)
+    assert list(marker.parent.iterdir()) == []
+
+
 # ----- Schema validation (parameterized per phase) -----
 
 VALID_ARTIFACTS = {
@@ -141,6 +161,37 @@ def test_schema_rejects_bad_verdict_enum(tmp_path):
     assert errors
 
 
+def test_phase_validator_built_once_per_process(tmp_path, monkeypatch):
+    monkeypatch.setattr(vga, "_VALIDATORS", {})
+    loads: list[str] = []
+    real_load = vga.load_schema
+    monkeypatch.setattr(vga, "load_schema", lambda phase: loads.append(phase) or real_load(phase))
+    artifact = tmp_path / "audit.json"
+    artifact.write_text(json.dumps(VALID_ARTIFACTS["audit"]), encoding="utf-8")
+    for _ in range(3):
+        assert vga.validate_one("audit", artifact) == []
+    assert vga._validate_data("audit", {"phase": "audit"})
+    assert loads == ["audit"]
+
+
+def test_phase_schema_file_parsed_once_with_registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(vga, "_VALIDATORS", {})
+    monkeypatch.setattr(vga, "_REGISTRY", None)
+    reads: list[str] = []
+    real_read_text = Path.read_text
+
+    def _spy(self, *args, **kwargs):
+        if self.parent == vga.SCHEMA_DIR:
+            reads.append(self.name)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _spy)
+    artifact = tmp_path / "audit.json"
+    artifact.write_text(json.dumps(VALID_ARTIFACTS["audit"]), encoding="utf-8")
+    assert vga.validate_one("audit", artifact) == []
+    assert reads.count("audit.schema.json") == 1
+
+
 # ----- Gate chain check_prior_artifact -----
 
 def test_check_prior_research_is_chain_start(tmp_path, monkeypatch):
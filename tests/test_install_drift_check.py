@@ -84,3 +84,21 @@ def test_scope_global_reads_home_dir_path(tmp_path, monkeypatch):
     drift = install_drift_check.check(host="claude", scope="global")
     # We expect drift (install is missing from fake home)
     assert isinstance(drift, list)
+
+
+def test_size_mismatch_flagged_without_reading_contents(tmp_path, monkeypatch):
+    _mk_source(tmp_path, {"sdlc/qor-s/SKILL.md": "short\n"})
+    install = tmp_path / ".claude"
+    _mk_install(install, {"qor-s/SKILL.md": "a much longer installed body\n"})
+    monkeypatch.chdir(tmp_path)
+    reads: list[Path] = []
+    real_open = open
+
+    def tracking_open(file, *args, **kwargs):
+        reads.append(Path(file))
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    drift = install_drift_check.check(host="claude", scope="repo")
+    assert any("qor-s" in d and d.startswith("SHA256 mismatch:") for d in drift)
+    assert not any(p.name == "SKILL.md" for p in reads)
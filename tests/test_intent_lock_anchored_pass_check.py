@@ -98,3 +98,36 @@ def test_audit_body_with_veto_rejects(tmp_path):
         Verdict: VETO
     """)
     assert not _audit_has_pass(audit)
+
+
+def test_capture_reads_audit_once_for_verdict_and_hash(tmp_path, monkeypatch):
+    import argparse
+    import hashlib
+    import json
+    from pathlib import Path
+
+    from qor.reliability import intent_lock
+
+    plan = tmp_path / "plan.md"
+    plan.write_text("plan", encoding="utf-8")
+    audit = _write(tmp_path, """
+        # AUDIT REPORT
+
+        Verdict: PASS
+    """)
+    monkeypatch.setattr(intent_lock, "_head_commit", lambda repo: "0" * 40)
+    reads: list[str] = []
+    original = Path.read_bytes
+
+    def counting_read_bytes(self):
+        reads.append(self.name)
+        return original(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    args = argparse.Namespace(
+        repo=str(tmp_path), plan=str(plan), audit=str(audit), session="s-once",
+    )
+    assert intent_lock.capture(args) == 0
+    assert reads.count("audit.md") == 1
+    data = json.loads((tmp_path / ".qor" / "intent-lock" / "s-once.json").read_text())
+    assert data["audit_hash"] == hashlib.sha256(audit.read_bytes()).hexdigest()
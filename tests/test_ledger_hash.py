@@ -109,6 +109,21 @@ def test_write_manifest_recurses_directories(tmp_path):
     assert "sub/deeper/nested.txt" in paths
 
 
+def test_write_manifest_hashes_each_file_once_across_overlapping_globs(tmp_path, monkeypatch):
+    sub = tmp_path / "sub" / "deeper"
+    sub.mkdir(parents=True)
+    (sub / "nested.txt").write_bytes(b"nested")
+    (tmp_path / "top.txt").write_bytes(b"top")
+    hashed: list[str] = []
+    real = lh.content_hash
+    monkeypatch.setattr(lh, "content_hash", lambda p: hashed.append(p.name) or real(p))
+    manifest = lh.write_manifest(
+        tmp_path, ["*.txt", "sub/**", "**/*.txt"], tmp_path / "manifest.json",
+    )
+    assert [p["path"] for p in manifest["paths"]] == ["sub/deeper/nested.txt", "top.txt"]
+    assert sorted(hashed) == ["nested.txt", "top.txt"]
+
+
 def test_write_manifest_reproducible(tmp_path):
     """Same input tree → same manifest content (excluding generated_ts)."""
     for name in ("a", "b", "c"):
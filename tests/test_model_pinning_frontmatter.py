@@ -72,6 +72,15 @@ def test_lint_passes_when_current_model_exceeds_minimum(tmp_path):
     assert warnings == []
 
 
+@pytest.mark.parametrize("current_tier", _CAPABILITY_ORDER)
+@pytest.mark.parametrize("min_tier", _CAPABILITY_ORDER)
+def test_lint_tier_comparison_follows_capability_order(tmp_path, current_tier, min_tier):
+    repo = _make_repo(tmp_path, f"min_model_capability: {min_tier}")
+    warnings = check(repo, current_model=f"claude-{current_tier}-4-6")
+    below = _CAPABILITY_ORDER.index(current_tier) < _CAPABILITY_ORDER.index(min_tier)
+    assert bool(warnings) is below
+
+
 def test_lint_warns_when_current_model_not_in_compatibility_list(tmp_path):
     repo = _make_repo(tmp_path, "model_compatibility: [claude-opus-4-7]")
     warnings = check(repo, current_model="claude-sonnet-4-6")
@@ -93,6 +93,30 @@ def test_record_with_justification_attaches_field():
     assert out["event_type"] == "gate_override"
 
 
+def test_count_skips_json_parse_for_other_sessions(tmp_path, monkeypatch):
+    events = _override("sess-1", 2) + _override("sess-10", 1) + _override("other", 5)
+    events.append({"event_type": "regression", "session_id": "sess-1"})
+    log = tmp_path / "shadow.md"
+    log.write_text(
+        "# Shadow Genome\n\nprose mentioning sess-1\n\n"
+        + "\n".join(json.dumps(e) for e in events) + "\n",
+        encoding="utf-8",
+    )
+    parsed: list[str] = []
+    real_loads = json.loads
+    monkeypatch.setattr(
+        override_friction.json, "loads", lambda s, **kw: parsed.append(s) or real_loads(s, **kw),
+    )
+    assert check("sess-1", log_path=log).count == 2
+    assert len(parsed) == 3  # two sess-1 overrides + the sess-10 prefix collision
+
+
+def test_count_handles_session_ids_json_would_escape(tmp_path):
+    log = _write_log(tmp_path, _override('sess-"q"', 2) + _override("sess-é", 1))
+    assert check('sess-"q"', log_path=log).count == 2
+    assert check("sess-é", log_path=log).count == 1
+
+
 def test_record_with_justification_rejects_non_string():
     event = {"event_type": "gate_override"}
     with pytest.raises(ValueError, match="must be a string"):
@@ -29,6 +29,17 @@ def test_lint_detects_substring_presence_pattern(tmp_path):
     assert warnings[0].pattern == "substring-presence"
 
 
+def test_lint_substring_presence_matches_after_repeated_keyword(tmp_path):
+    noisy = "contains " * 2000
+    plan = _write_plan(tmp_path, f"""
+        ### Unit Tests
+        - `test_a` — asserts {noisy}nothing else.
+        - `test_b` — asserts {noisy}the literal "foo".
+    """)
+    warnings = check_plan(plan)
+    assert [(w.line, w.pattern) for w in warnings] == [(4, "substring-presence")]
+
+
 def test_lint_detects_section_exists_pattern(tmp_path):
     plan = _write_plan(tmp_path, """
         ### Unit Tests
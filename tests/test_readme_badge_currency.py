@@ -137,3 +137,17 @@ def test_check_currency_reports_mismatch_for_synthetic_drift(tmp_path):
     assert any("skills" in m.lower() for m in mismatches), (
         f"mismatch list should name 'skills'; got {mismatches}"
     )
+
+
+def test_count_ledger_entries_matches_line_anchored_regex(tmp_path):
+    import re
+    from qor.scripts.badge_currency import count_ledger_entries
+    ledger = tmp_path / "META_LEDGER.md"
+    text = "### Entry #1\nbody ### Entry #x\n\n### Entry #2\n  ### Entry #3\n### Entry #4"
+    ledger.write_text(text, encoding="utf-8")
+    expected = len(re.findall(r"^### Entry #", text, re.MULTILINE))
+    assert count_ledger_entries(ledger) == expected == 3
+    real = REPO_ROOT / "docs" / "META_LEDGER.md"
+    assert count_ledger_entries(real) == len(
+        re.findall(r"^### Entry #", real.read_text(encoding="utf-8"), re.MULTILINE)
+    )
@@ -266,6 +266,85 @@ def test_mark_addressed_pending_surfaces_missing_ids(tmp_path):
     assert missing == [fake_id]
 
 
+def test_mark_addressed_pending_restores_logs_when_a_rewrite_fails(tmp_path):
+    """Cross-log flip is all-or-nothing: a failed rewrite restores earlier ones."""
+    local = tmp_path / "local.md"
+    upstream = tmp_path / "upstream.md"
+    e_local = make_event(session_id="s-local-rb")
+    e_upstream = make_event(session_id="s-upstream-rb")
+    _seed(local, [e_local])
+    _seed(upstream, [e_upstream])
+    local_before = local.read_bytes()
+    real_write = shadow_process._write_events_locked
+
+    def failing_write(events, log_path):
+        if log_path == upstream:
+            raise OSError("disk full")
+        real_write(events, log_path)
+
+    with mock.patch.object(shadow_process, "LOCAL_LOG_PATH", local), \
+         mock.patch.object(shadow_process, "UPSTREAM_LOG_PATH", upstream), \
+         mock.patch.object(shadow_process, "_write_events_locked", failing_write):
+        with pytest.raises(OSError):
+            rma.mark_addressed_pending(
+                [e_local["id"], e_upstream["id"]], session_id="rb-session"
+            )
+    assert local.read_bytes() == local_before
+
+
+def test_mark_addressed_pending_holds_both_log_locks(tmp_path):
+    fcntl = pytest.importorskip("fcntl")
+    local = tmp_path / "local.md"
+    upstream = tmp_path / "upstream.md"
+    e_local = make_event(session_id="s-lock")
+    _seed(local, [e_local])
+    upstream.write_text("", encoding="utf-8")
+    blocked: list[bool] = []
+    real_read = shadow_process.read_all_events_with_sources
+
+    def probing_read():
+        # First call is the lock-free probe; the locked re-read follows it.
+        for path in (local, upstream):
+            with open(path.parent / (path.name + ".lock"), "a") as fh:
+                try:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    blocked.append(True)
+                else:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        return real_read()
+
+    with mock.patch.object(shadow_process, "LOCAL_LOG_PATH", local), \
+         mock.patch.object(shadow_process, "UPSTREAM_LOG_PATH", upstream), \
+         mock.patch.object(shadow_process, "read_all_events_with_sources", probing_read):
+        rma.mark_addressed_pending([e_local["id"]], session_id="lock-session")
+    assert blocked == [True, True]
+
+
+def test_mark_addressed_pending_without_match_creates_no_files(tmp_path):
+    """A run that flips nothing must not create log dirs or lock sidecars."""
+    local = tmp_path / "docs" / "local.md"
+    upstream = tmp_path / "docs" / "upstream.md"
+    with mock.patch.object(shadow_process, "LOCAL_LOG_PATH", local), \
+         mock.patch.object(shadow_process, "UPSTREAM_LOG_PATH", upstream):
+        flipped, missing = rma.mark_addressed_pending(["e" * 64], session_id="none")
+    assert (flipped, missing) == (0, ["e" * 64])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_mark_addressed_pending_locks_absent_log_without_creating_it(tmp_path):
+    local = tmp_path / "local.md"
+    upstream = tmp_path / "upstream.md"
+    e_local = make_event(session_id="s-absent")
+    _seed(local, [e_local])
+    with mock.patch.object(shadow_process, "LOCAL_LOG_PATH", local), \
+         mock.patch.object(shadow_process, "UPSTREAM_LOG_PATH", upstream):
+        flipped, _ = rma.mark_addressed_pending([e_local["id"]], session_id="absent")
+    assert flipped == 1
+    assert (tmp_path / "upstream.md.lock").exists()
+    assert not upstream.exists()
+
+
 # ===== Track E: remediate_emit_gate =====
 
 def test_emit_gate_writes_json_at_expected_path(tmp_path):
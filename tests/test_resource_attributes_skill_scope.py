@@ -93,3 +93,39 @@ def test_canonical_tools_set_is_frozen():
     assert "Bash" in _CANONICAL_TOOLS
     assert "Agent" in _CANONICAL_TOOLS
     assert len(_CANONICAL_TOOLS) >= 8
+
+
+def _separate_pass_scan(body: str) -> tuple[set[str], set[str]]:
+    """Reference: one regex pass per signal, as before the fused scan."""
+    import re
+    tools = {
+        tool for tool in _CANONICAL_TOOLS
+        if tool != "Bash" and re.search(rf"\bTool:\s*{tool}\b", body)
+    }
+    if re.search(r"```(?:bash|shell|sh)\b", body, re.IGNORECASE):
+        tools.add("Bash")
+    subagents = set(re.findall(
+        r"Agent\s*\(\s*(?:[^)]*?,\s*)?subagent_type\s*=\s*[\"']([^\"']+)[\"']", body,
+    ))
+    return tools, subagents
+
+
+def test_fused_body_scan_matches_separate_passes():
+    from qor.policy.resource_attributes import _scan_body
+    body = (
+        "Tool: WebFetch then Tool:Write\nTool: Writer\nTool: Bash\n"
+        "```SHELL\nls\n```\nTool: Agent(subagent_type='qor-judge')\n"
+        'Agent(description="x", subagent_type="qor-scout")\n'
+    )
+    assert _scan_body(body) == _separate_pass_scan(body) == (
+        {"WebFetch", "Write", "Agent", "Bash"}, {"qor-judge", "qor-scout"},
+    )
+
+
+def test_fused_body_scan_matches_separate_passes_on_repo_skills():
+    from qor.policy.resource_attributes import _scan_body
+    skills = sorted((Path(__file__).resolve().parent.parent / "qor" / "skills").rglob("SKILL.md"))
+    assert skills
+    for skill in skills:
+        body = skill.read_text(encoding="utf-8")
+        assert _scan_body(body) == _separate_pass_scan(body), skill
@@ -56,17 +56,17 @@ def test_medium2_valid_jsonl_no_warning(tmp_path, capsys):
 
 # ----- MEDIUM-3: file locking -----
 
-def test_medium3_atomic_append_uses_locking(tmp_path, monkeypatch):
-    """_atomic_append acquires a file lock during write."""
+def test_medium3_locked_append_uses_locking(tmp_path, monkeypatch):
+    """_locked_append acquires a file lock during write."""
     from qor.scripts import shadow_process
     target = tmp_path / "test.jsonl"
     target.write_text("", encoding="utf-8")
 
     lock_acquired = []
-    original_atomic = shadow_process._atomic_append
+    original_atomic = shadow_process._locked_append
 
     # The locking is internal; verify no crash and file is written
-    shadow_process._atomic_append(target, '{"test": true}\n')
+    shadow_process._locked_append(target, '{"test": true}\n')
     content = target.read_text(encoding="utf-8")
     assert '{"test": true}' in content
 
@@ -97,3 +97,59 @@ def test_seed_result_namedtuple_shape():
     r = SeedResult(created=["a"], skipped=["b"])
     assert r.created == ["a"]
     assert r.skipped == ["b"]
+
+
+def test_seed_reseed_skips_template_reads_and_repeat_mkdirs(tmp_path, monkeypatch):
+    import qor.seed as seed_mod
+    seed_mod.seed(base=tmp_path, quiet=True)
+    reads: list[str] = []
+    monkeypatch.setattr(seed_mod, "_read_template", lambda name: reads.append(name) or b"")
+    made: list[Path] = []
+    original = Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        made.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    result = seed_mod.seed(base=tmp_path, quiet=True)
+    assert result.created == []
+    assert reads == []
+    assert len(made) == len(set(made))
+
+
+def test_seed_reseed_does_not_probe_existing_targets(tmp_path, monkeypatch):
+    import qor.seed as seed_mod
+    seed_mod.seed(base=tmp_path, quiet=True)
+    probes: list[Path] = []
+    original = Path.exists
+
+    def recording_exists(self, *args, **kwargs):
+        probes.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "exists", recording_exists)
+    result = seed_mod.seed(base=tmp_path, quiet=True)
+    monkeypatch.undo()
+    assert probes == []
+    assert result.created == []
+
+
+def test_seed_failed_template_read_leaves_no_partial_file(tmp_path, monkeypatch):
+    import qor.seed as seed_mod
+
+    def _boom(name):
+        raise OSError(f"cannot read {name}")
+
+    monkeypatch.setattr(seed_mod, "_read_template", _boom)
+    with pytest.raises(OSError):
+        seed_mod.seed(base=tmp_path, quiet=True)
+    assert not (tmp_path / "docs/META_LEDGER.md").exists()
+
+
+def test_seed_templates_copied_byte_for_byte(tmp_path):
+    from qor import resources
+    from qor.seed import seed
+    seed(base=tmp_path, quiet=True)
+    template = Path(str(resources.asset("templates"))) / "CONCEPT.md"
+    assert (tmp_path / "docs/CONCEPT.md").read_bytes() == template.read_bytes()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -55,6 +56,16 @@ def test_event_id_differs_on_severity():
     assert a["id"] != b["id"]
 
 
+def test_event_id_matches_canonical_json_details():
+    import hashlib
+    ev = make_event(details={"b": "é", "a": [1, 2]})
+    expected = hashlib.sha256("|".join([
+        ev["ts"], ev["skill"], ev["session_id"], ev["event_type"], str(ev["severity"]),
+        json.dumps(ev["details"], sort_keys=True, separators=(",", ":")), "",
+    ]).encode("utf-8")).hexdigest()
+    assert ev["id"] == expected
+
+
 def test_schema_validates_well_formed_event():
     e = make_event()
     shadow_process.validate(e)
@@ -102,13 +113,11 @@ def test_threshold_breach_triggers_marker(tmp_path, monkeypatch):
 
     rc = cst.main.__wrapped__() if hasattr(cst.main, "__wrapped__") else None
     # Call main via args
-    import sys as _s
-    old_argv = _s.argv
-    _s.argv = ["check_shadow_threshold", "--log", str(log), "--now", "2026-04-15T13:00:00Z"]
-    try:
-        rc = cst.main()
-    finally:
-        _s.argv = old_argv
+    monkeypatch.setattr(
+        sys, "argv",
+        ["check_shadow_threshold", "--log", str(log), "--now", "2026-04-15T13:00:00Z"],
+    )
+    rc = cst.main()
 
     assert rc == 10
     assert marker.exists()
@@ -126,8 +135,7 @@ def test_under_threshold_no_marker(tmp_path, monkeypatch):
     marker.write_text("{}", encoding="utf-8")  # stale marker from prior run
     monkeypatch.setattr(cst, "MARKER_PATH", marker)
 
-    import sys as _s
-    _s.argv = ["check", "--log", str(log), "--now", "2026-04-15T13:00:00Z"]
+    monkeypatch.setattr(sys, "argv", ["check", "--log", str(log), "--now", "2026-04-15T13:00:00Z"])
     rc = cst.main()
     assert rc == 0
     assert not marker.exists()  # stale marker removed
@@ -150,6 +158,19 @@ def test_stale_expiry_sev2(tmp_path):
     assert updated[0]["addressed"] is True
 
 
+@pytest.mark.parametrize("now", [
+    datetime(2026, 7, 14, 0, 0, 0, tzinfo=timezone.utc),
+    datetime(2026, 7, 14, 0, 0, 0, 500_000, tzinfo=timezone.utc),
+    datetime(2026, 7, 13, 23, 59, 59, 999_999, tzinfo=timezone.utc),
+])
+def test_stale_cutoff_matches_age_days_boundary(now):
+    # ts-string cutoff must agree with the parsed-age rule: stale iff age.days >= 90.
+    e = make_event(severity=1, ts="2026-04-15T00:00:00Z")
+    updated, _, _ = cst.sweep([e], now)
+    expected = (now - cst.parse_ts(e["ts"])).days >= cst.STALE_DAYS
+    assert updated[0]["addressed"] is expected
+
+
 def test_sev3_never_stale_expires():
     now = datetime(2027, 4, 15, tzinfo=timezone.utc)  # ~1 year after
     e = make_event(severity=3, ts="2026-04-15T00:00:00Z")
@@ -228,8 +249,7 @@ def test_create_shadow_issue_flips_addressed(tmp_path, monkeypatch):
 
     monkeypatch.setattr(subprocess, "run", fake_run)
 
-    import sys as _s
-    _s.argv = ["create_shadow_issue", "--log", str(log)]
+    monkeypatch.setattr(sys, "argv", ["create_shadow_issue", "--log", str(log)])
     rc = csi.main()
     assert rc == 0
 
@@ -255,8 +275,7 @@ def test_create_shadow_issue_no_matching_events(tmp_path, monkeypatch):
         "event_ids": ["0" * 64],  # no match
     }), encoding="utf-8")
 
-    import sys as _s
-    _s.argv = ["create_shadow_issue", "--log", str(log), "--skip-auth"]
+    monkeypatch.setattr(sys, "argv", ["create_shadow_issue", "--log", str(log), "--skip-auth"])
     rc = csi.main()
     assert rc == 0  # graceful exit, nothing done
 
@@ -290,21 +309,146 @@ def test_mark_resolved_skips_already_addressed(tmp_path):
     assert flipped == 1  # only e2 was unaddressed
 
 
-def test_mark_resolved_cli_requires_events(tmp_path):
+def test_update_events_holds_write_lock_across_read_modify_write(tmp_path):
+    fcntl = pytest.importorskip("fcntl")
+    e1 = make_event()
+    log = tmp_path / "shadow.md"
+    shadow_process.append_event(e1, log_path=log)
+    lock_path = tmp_path / "shadow.md.lock"
+
+    def _mutate(events: list[dict]) -> int:
+        with open(lock_path, "r") as other:
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(other.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        events[0]["addressed"] = True
+        return 1
+
+    assert shadow_process.update_events(log, _mutate) == 1
+    assert shadow_process.read_events(log)[0]["addressed"] is True
+
+
+def test_update_all_events_locks_log_it_creates(tmp_path, monkeypatch):
+    fcntl = pytest.importorskip("fcntl")
+    local = tmp_path / "local.md"
+    upstream = tmp_path / "upstream.md"
+    shadow_process.append_event(make_event(), log_path=local)
+    monkeypatch.setattr(shadow_process, "LOCAL_LOG_PATH", local)
+    monkeypatch.setattr(shadow_process, "UPSTREAM_LOG_PATH", upstream)
+    new_event = make_event(session_id="s-new")
+    real_write = shadow_process._write_events_locked
+    blocked: list[Path] = []
+
+    def probing_write(events, log_path):
+        with open(log_path.with_name(log_path.name + ".lock"), "a") as other:
+            try:
+                fcntl.flock(other.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                blocked.append(log_path)
+            else:
+                fcntl.flock(other.fileno(), fcntl.LOCK_UN)
+        real_write(events, log_path)
+
+    def _register(events, src_map):
+        events.append(dict(new_event))
+        src_map[new_event["id"]] = upstream
+        return [new_event["id"]]
+
+    monkeypatch.setattr(shadow_process, "_write_events_locked", probing_write)
+    assert shadow_process.update_all_events(_register) == [new_event["id"]]
+    assert blocked == [upstream]
+    assert [e["id"] for e in shadow_process.read_events(upstream)] == [new_event["id"]]
+
+
+def _append_after_first_read(monkeypatch, log: Path, late: dict) -> None:
+    """Simulate a writer appending ``late`` right after the first lock-free read."""
+    real_read = shadow_process.read_all_events_with_sources
+    calls: list[int] = []
+
+    def racing_read():
+        result = real_read()
+        if not calls:
+            shadow_process.append_event(late, log_path=log)
+        calls.append(1)
+        return result
+
+    monkeypatch.setattr(shadow_process, "read_all_events_with_sources", racing_read)
+
+
+def test_threshold_sweep_keeps_event_appended_during_sweep(tmp_path, monkeypatch):
+    local = tmp_path / "local.md"
+    upstream = tmp_path / "upstream.md"
+    stale = make_event(severity=1, ts="2026-01-01T00:00:00Z")
+    shadow_process.append_event(stale, log_path=local)
+    late = make_event(session_id="s-late", ts="2026-05-01T00:00:00Z")
+    monkeypatch.setattr(shadow_process, "LOCAL_LOG_PATH", local)
+    monkeypatch.setattr(shadow_process, "UPSTREAM_LOG_PATH", upstream)
+    monkeypatch.setattr(cst, "MARKER_PATH", tmp_path / "marker.json")
+    _append_after_first_read(monkeypatch, local, late)
+    monkeypatch.setattr(sys, "argv", ["check", "--now", "2026-05-02T00:00:00Z"])
+    assert cst.main() == 0
+    after = {e["id"]: e for e in shadow_process.read_events(local)}
+    assert after[stale["id"]]["addressed_reason"] == "stale"
+    assert late["id"] in after
+
+
+def test_create_shadow_issue_keeps_event_appended_during_issue_call(tmp_path, monkeypatch):
+    local = tmp_path / "local.md"
+    upstream = tmp_path / "upstream.md"
+    target = make_event(severity=5)
+    shadow_process.append_event(target, log_path=upstream)
+    late = make_event(session_id="s-late")
+    monkeypatch.setattr(shadow_process, "LOCAL_LOG_PATH", local)
+    monkeypatch.setattr(shadow_process, "UPSTREAM_LOG_PATH", upstream)
+    monkeypatch.setattr(csi, "MARKER_PATH", tmp_path / "marker.json")
+    fake_url = "https://github.com/MythologIQ-Labs-LLC/Qor-logic/issues/7"
+
+    def fake_create_issue(repo, title, body):
+        shadow_process.append_event(late, log_path=upstream)
+        return fake_url
+
+    monkeypatch.setattr(csi, "create_issue", fake_create_issue)
+    monkeypatch.setattr(
+        sys, "argv", ["create", "--skip-auth", "--events", target["id"]],
+    )
+    assert csi.main() == 0
+    after = {e["id"]: e for e in shadow_process.read_events(upstream)}
+    assert after[target["id"]]["issue_url"] == fake_url
+    assert after[late["id"]]["addressed"] is False
+
+
+def test_exclusive_lock_creates_sidecar_without_touch(tmp_path, monkeypatch):
+    log = tmp_path / "nested" / "shadow.md"
+
+    def _no_touch(self, *a, **k):
+        raise AssertionError("sidecar should be created by open(), not touch()")
+    monkeypatch.setattr(Path, "touch", _no_touch)
+    shadow_process.append_event(make_event(), log_path=log)
+    shadow_process.append_event(make_event(session_id="s-2"), log_path=log)
+    assert (tmp_path / "nested" / "shadow.md.lock").read_bytes() == b""
+    assert len(shadow_process.read_events(log)) == 2
+
+
+def test_update_events_skips_write_when_nothing_changed(tmp_path):
+    log = tmp_path / "shadow.md"
+    shadow_process.append_event(make_event(), log_path=log)
+    before = log.stat().st_mtime_ns
+    assert shadow_process.update_events(log, lambda events: 0) == 0
+    assert log.stat().st_mtime_ns == before
+
+
+def test_mark_resolved_cli_requires_events(tmp_path, monkeypatch):
     log = tmp_path / "shadow.md"
     log.write_text("", encoding="utf-8")
-    import sys as _s
-    _s.argv = ["create", "--mark-resolved", "--log", str(log)]
+    monkeypatch.setattr(sys, "argv", ["create", "--mark-resolved", "--log", str(log)])
     rc = csi.main()
     assert rc == 2  # missing --events
 
 
-def test_mark_resolved_cli_happy_path(tmp_path):
+def test_mark_resolved_cli_happy_path(tmp_path, monkeypatch):
     e = make_event(severity=3)
     log = tmp_path / "shadow.md"
     log.write_text(json.dumps(e) + "\n", encoding="utf-8")
-    import sys as _s
-    _s.argv = ["create", "--mark-resolved", "--log", str(log), "--events", e["id"]]
+    monkeypatch.setattr(sys, "argv", ["create", "--mark-resolved", "--log", str(log), "--events", e["id"]])
     rc = csi.main()
     assert rc == 0
     after = shadow_process.read_events(log)
@@ -314,6 +458,22 @@ def test_mark_resolved_cli_happy_path(tmp_path):
 
 # ----- Append helper -----
 
+def test_read_events_skips_prose_and_malformed_lines(tmp_path, capsys):
+    log = tmp_path / "shadow.md"
+    good = make_event()
+    log.write_text(
+        "# Process Shadow Genome\n\nprose\n"
+        + "  " + json.dumps(good) + "  \n"
+        + "{not json\n"
+        + json.dumps(good) + " trailing\n",
+        encoding="utf-8",
+    )
+    assert shadow_process.read_events(log) == [good]
+    err = capsys.readouterr().err
+    assert "malformed JSONL line 5" in err and "malformed JSONL line 6" in err
+    assert shadow_process.read_events(tmp_path / "absent.md") == []
+
+
 def test_append_event_atomic(tmp_path):
     log = tmp_path / "shadow.md"
     e = make_event()
@@ -337,6 +497,43 @@ def test_append_multiple_preserves_order(tmp_path):
     assert events[0]["ts"] < events[1]["ts"] < events[2]["ts"]
 
 
+def test_append_extends_file_in_place_and_repairs_missing_newline(tmp_path):
+    log = tmp_path / "shadow.md"
+    log.write_text("# Shadow Genome\n\nprose without newline", encoding="utf-8")
+    inode = log.stat().st_ino
+    e = make_event()
+    del e["id"]
+    shadow_process.append_event(e, log_path=log)
+    assert log.stat().st_ino == inode  # appended, not rewritten via os.replace
+    text = log.read_text(encoding="utf-8")
+    assert text.startswith("# Shadow Genome\n\nprose without newline\n{")
+    assert text.endswith("}\n")
+    assert len(shadow_process.read_events(log)) == 1
+
+
+def test_append_events_batch_returns_ids_in_order(tmp_path):
+    log = tmp_path / "shadow.md"
+    batch = [make_event(session_id=f"s-{i}") for i in range(3)]
+    for e in batch:
+        del e["id"]
+    ids = shadow_process.append_events(batch, log_path=log)
+    stored = shadow_process.read_events(log)
+    assert [e["id"] for e in stored] == ids
+    assert [e["session_id"] for e in stored] == ["s-0", "s-1", "s-2"]
+
+
+def test_append_events_rejects_whole_batch_on_invalid_event(tmp_path):
+    import jsonschema
+    log = tmp_path / "shadow.md"
+    good = make_event()
+    bad = make_event(session_id="s-bad", severity=9)
+    for e in (good, bad):
+        del e["id"]
+    with pytest.raises(jsonschema.ValidationError):
+        shadow_process.append_events([good, bad], log_path=log)
+    assert not log.exists()
+
+
 # ----- Phase 14: classification-aware append -----
 
 def test_append_event_classifies_upstream(tmp_path):
@@ -355,18 +552,43 @@ def test_append_event_classifies_upstream(tmp_path):
 def test_id_source_map_distinguishes_files(tmp_path):
     local = tmp_path / "local.md"
     upstream = tmp_path / "upstream.md"
-    e1 = make_event(session_id="s-local")
-    e2 = make_event(session_id="s-upstream")
-    shadow_process.append_event(e1, log_path=local)
-    shadow_process.append_event(e2, log_path=upstream)
+    # Seed each log with one batched append (one lock, one write per file).
+    local_ids = shadow_process.append_events(
+        [make_event(session_id=f"s-local-{i}") for i in range(2)], log_path=local,
+    )
+    upstream_ids = shadow_process.append_events(
+        [make_event(session_id=f"s-upstream-{i}") for i in range(2)],
+        log_path=upstream,
+    )
     import unittest.mock as mock
     with mock.patch.object(shadow_process, "LOCAL_LOG_PATH", local), \
          mock.patch.object(shadow_process, "UPSTREAM_LOG_PATH", upstream):
         src_map = shadow_process.id_source_map()
-    stored_local = shadow_process.read_events(local)
-    stored_upstream = shadow_process.read_events(upstream)
-    assert src_map[stored_local[0]["id"]] == local
-    assert src_map[stored_upstream[0]["id"]] == upstream
+    assert [e["id"] for e in shadow_process.read_events(local)] == local_ids
+    assert [e["id"] for e in shadow_process.read_events(upstream)] == upstream_ids
+    assert src_map == {
+        **{eid: local for eid in local_ids},
+        **{eid: upstream for eid in upstream_ids},
+    }
+
+
+def test_read_all_events_with_sources_parses_each_log_once(tmp_path, monkeypatch):
+    local = tmp_path / "local.md"
+    upstream = tmp_path / "upstream.md"
+    shadow_process.append_event(make_event(session_id="s-local"), log_path=local)
+    shadow_process.append_event(make_event(session_id="s-upstream"), log_path=upstream)
+    monkeypatch.setattr(shadow_process, "LOCAL_LOG_PATH", local)
+    monkeypatch.setattr(shadow_process, "UPSTREAM_LOG_PATH", upstream)
+    reads: list[Path] = []
+    real_read = shadow_process.read_events
+    monkeypatch.setattr(
+        shadow_process, "read_events",
+        lambda path=None: reads.append(path) or real_read(path),
+    )
+    events, src_map = shadow_process.read_all_events_with_sources()
+    assert reads == [local, upstream]
+    assert [e["session_id"] for e in events] == ["s-local", "s-upstream"]
+    assert src_map == {events[0]["id"]: local, events[1]["id"]: upstream}
 
 
 def test_escalation_events_not_dropped_during_sweep(tmp_path):
@@ -126,3 +126,22 @@ def test_write_events_per_source_splits_correctly(tmp_path):
     assert local_events[1]["severity"] == 20
     assert len(upstream_events) == 1
     assert upstream_events[0]["severity"] == 30
+
+
+def test_write_events_per_source_skips_logs_without_changed_ids(tmp_path):
+    local_log = tmp_path / "local.md"
+    upstream_log = tmp_path / "upstream.md"
+    e1 = {"id": "aaa", "ts": "2026-04-15T12:00:00Z", "severity": 1}
+    e2 = {"id": "bbb", "ts": "2026-04-15T13:00:00Z", "severity": 2}
+    local_log.write_text(json.dumps(e1) + "\n", encoding="utf-8")
+    upstream_log.write_text(json.dumps(e2) + "\n", encoding="utf-8")
+    upstream_before = upstream_log.read_bytes()
+    upstream_inode = upstream_log.stat().st_ino
+    src_map = {"aaa": local_log, "bbb": upstream_log}
+
+    e1["severity"] = 5
+    shadow_process.write_events_per_source([e1, e2], src_map, ["aaa"])
+
+    assert shadow_process.read_events(local_log)[0]["severity"] == 5
+    assert upstream_log.stat().st_ino == upstream_inode
+    assert upstream_log.read_bytes() == upstream_before
@@ -81,3 +81,18 @@ def test_schema_invariant_stale_does_not_require_pending():
     )
     assert "addressed_pending" not in event
     shadow_process.validate(event)
+
+
+def test_validate_reuses_checked_validator(monkeypatch):
+    monkeypatch.setattr(shadow_process, "_VALIDATOR_CACHE", None)
+    checks: list[dict] = []
+    real_check = jsonschema.Draft202012Validator.check_schema
+    monkeypatch.setattr(
+        jsonschema.Draft202012Validator, "check_schema",
+        classmethod(lambda cls, schema, **kw: checks.append(schema) or real_check(schema, **kw)),
+    )
+    shadow_process.validate(_base_event())
+    shadow_process.validate(_base_event(severity=2))
+    with pytest.raises(jsonschema.ValidationError):
+        shadow_process.validate(_base_event(severity=9))
+    assert len(checks) == 1
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import ast
+import functools
 import re
 from pathlib import Path
 
@@ -12,11 +13,17 @@ DOCTRINE = REPO_ROOT / "qor" / "references" / "doctrine-shadow-genome-countermea
 QOR_PLAN_SKILL = REPO_ROOT / "qor" / "skills" / "sdlc" / "qor-plan" / "SKILL.md"
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_source(source: bytes) -> ast.Module:
+    """Parse once per unique file body; both SG-033 passes walk qor/scripts."""
+    return ast.parse(source)
+
+
 def _collect_keyword_only_functions(root: Path) -> dict[str, tuple[Path, int, list[str]]]:
     """Return {fn_name: (def_file, lineno, positional_arg_names)}."""
     out: dict[str, tuple[Path, int, list[str]]] = {}
     for py in root.rglob("*.py"):
-        tree = ast.parse(py.read_text(encoding="utf-8"))
+        tree = _parse_source(py.read_bytes())
         for node in ast.walk(tree):
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.args.kwonlyargs:
                 positional = [a.arg for a in node.args.args]
@@ -39,7 +46,7 @@ def _find_positional_violations(
     violations: list[tuple[Path, int, str]] = []
     for root in search_roots:
         for py in root.rglob("*.py"):
-            tree = ast.parse(py.read_text(encoding="utf-8"))
+            tree = _parse_source(py.read_bytes())
             for node in ast.walk(tree):
                 if not isinstance(node, ast.Call):
                     continue
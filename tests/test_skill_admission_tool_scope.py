@@ -60,6 +60,34 @@ def test_admit_skips_skills_without_advisory_frontmatter(tmp_path):
     assert ok
 
 
+def test_check_admission_reads_skill_file_once(tmp_path, monkeypatch):
+    skill = _write_skill(tmp_path,
+        "name: test-skill\ndescription: d\nphase: plan\npermitted_tools: [Bash]\npermitted_subagents: []",
+        "```bash\necho hi\n```\n")
+    reads: list[Path] = []
+    real_read_text = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    admitted, msg = check_admission("test-skill", {"test-skill": skill})
+    assert admitted, msg
+    assert reads.count(skill) == 1
+
+
+def test_advisory_skill_skips_attribute_scan(tmp_path, monkeypatch):
+    import qor.policy.resource_attributes as ra
+    skill = _write_skill(tmp_path, "name: x", "Tool: Read\n")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("attribute scan should not run for advisory skills")
+
+    monkeypatch.setattr(ra, "compute_skill_admission_attributes", fail)
+    assert check_tool_scope("test-skill", skill)[0]
+
+
 def test_admit_passes_for_eight_actual_repo_skills():
     """Self-application: this Phase 55 implementation must satisfy its own policy."""
     failed: list[str] = []
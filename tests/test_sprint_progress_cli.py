@@ -50,6 +50,29 @@ def test_compute_progress_handles_no_brief(tmp_path):
     assert entries == []
 
 
+def test_compute_progress_resolves_bundles_through_heading_index(tmp_path):
+    repo = tmp_path / "repo"
+    docs = repo / "docs"
+    _write_brief(docs / "research-brief-b-2026-05-03.md", """
+### Priority 1 — Phase 80 candidate: Alpha
+### Priority 12 — Phase 81 candidate: Beta
+
+Folded into Phase 80 with Priority 1.
+
+### Priority 2 — Phase 82 candidate: Gamma
+""")
+    _write_ledger(docs / "META_LEDGER.md", sealed_phases=[80])
+    _, entries = sprint_progress.compute_progress(repo)
+    assert {(e.priority.number, e.sealed) for e in entries} == {
+        (1, True), (12, True), (2, False),
+    }
+    index = sprint_progress._index_priority_headings(
+        (docs / "research-brief-b-2026-05-03.md").read_text(encoding="utf-8")
+    )
+    assert list(index) == ["1", "12", "2"]
+    assert index["12"] == "### Priority 12 — Phase 81 candidate: Beta"
+
+
 def test_render_progress_emits_priority_status_table(tmp_path):
     repo = tmp_path / "repo"
     docs = repo / "docs"
@@ -110,6 +110,17 @@ def test_run_resets_on_implement_artifact_newer_than_prior_veto(tmp_path):
     assert count == 1
 
 
+def test_run_skips_directory_at_break_artifact_path(tmp_path):
+    sid = "s-dir-break"
+    _seed_audits(tmp_path, sid, [
+        _audit("2026-04-20T12:00:00Z", "VETO", ["razor-overage"], sid),
+        _audit("2026-04-20T12:02:00Z", "VETO", ["razor-overage"], sid),
+    ])
+    (tmp_path / sid / "implement.json").mkdir()
+    count, _, _ = _run(tmp_path, sid)
+    assert count == 2
+
+
 def test_run_returns_oldest_matching_timestamp(tmp_path):
     sid = "s-oldest"
     _seed_audits(tmp_path, sid, [
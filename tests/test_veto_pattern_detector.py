@@ -5,6 +5,12 @@ from pathlib import Path
 
 import pytest
 
+from qor.scripts.veto_pattern import (
+    PatternResult,
+    detect_repeated_veto_pattern,
+    parse_phase_audit_counts,
+)
+
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -13,69 +19,46 @@ def _read(name: str) -> str:
     return (FIXTURES / name).read_text(encoding="utf-8")
 
 
-def test_parse_no_pattern_returns_single_pass_per_phase():
-    from qor.scripts.veto_pattern import parse_phase_audit_counts
-    counts = parse_phase_audit_counts(_read("ledger_no_pattern.md"))
-    assert counts == {10: 1, 11: 1}
-
-
-def test_parse_pattern_fires_returns_multi_pass_counts():
-    from qor.scripts.veto_pattern import parse_phase_audit_counts
-    counts = parse_phase_audit_counts(_read("ledger_pattern_fires.md"))
-    assert counts == {24: 3, 25: 3}
-
-
-def test_parse_pattern_clears_includes_reset_phase():
-    from qor.scripts.veto_pattern import parse_phase_audit_counts
-    counts = parse_phase_audit_counts(_read("ledger_pattern_clears.md"))
-    assert counts == {24: 3, 25: 3, 26: 1}
-
-
-def test_detector_no_pattern():
-    from qor.scripts.veto_pattern import detect_repeated_veto_pattern
-    result = detect_repeated_veto_pattern({10: 1, 11: 1}, window=2)
-    assert result.detected is False
-    assert result.recent_phases == []
-
-
-def test_detector_pattern_fires_on_two_consecutive_multi_pass():
-    from qor.scripts.veto_pattern import detect_repeated_veto_pattern
-    result = detect_repeated_veto_pattern({24: 3, 25: 3}, window=2)
-    assert result.detected is True
-    assert result.recent_phases == [24, 25]
-    assert result.max_pass_count == 3
-
-
-def test_detector_resets_when_clean_phase_follows():
-    from qor.scripts.veto_pattern import detect_repeated_veto_pattern
-    result = detect_repeated_veto_pattern({24: 3, 25: 3, 26: 1}, window=2)
-    assert result.detected is False
-    assert result.recent_phases == []
-
-
-def test_detector_single_sealed_phase_not_enough():
-    from qor.scripts.veto_pattern import detect_repeated_veto_pattern
-    result = detect_repeated_veto_pattern({24: 1}, window=2)
-    assert result.detected is False
-
-
-def test_detector_one_phase_many_passes_is_not_the_pattern():
-    """B18 is CROSS-phase; a single phase with many passes does not fire."""
-    from qor.scripts.veto_pattern import detect_repeated_veto_pattern
-    result = detect_repeated_veto_pattern({24: 5}, window=2)
-    assert result.detected is False
-
-
-def test_detector_window_3_requires_three_consecutive():
-    from qor.scripts.veto_pattern import detect_repeated_veto_pattern
-    # Two consecutive multi-pass -- not enough for window=3
-    assert detect_repeated_veto_pattern({24: 3, 25: 3}, window=3).detected is False
-    # Three consecutive multi-pass -- detected
-    assert detect_repeated_veto_pattern({24: 3, 25: 3, 26: 2}, window=3).detected is True
+@pytest.mark.parametrize("fixture, expected", [
+    ("ledger_no_pattern.md", {10: 1, 11: 1}),
+    ("ledger_pattern_fires.md", {24: 3, 25: 3}),
+    # The reset phase is counted so the detector can see the clean break.
+    ("ledger_pattern_clears.md", {24: 3, 25: 3, 26: 1}),
+], ids=["no-pattern", "pattern-fires", "pattern-clears"])
+def test_parse_phase_audit_counts_from_fixture(fixture, expected):
+    assert parse_phase_audit_counts(_read(fixture)) == expected
+
+
+_NOT_DETECTED = PatternResult(detected=False, recent_phases=[], max_pass_count=0)
+
+
+@pytest.mark.parametrize("counts, window, expected", [
+    ({10: 1, 11: 1}, 2, _NOT_DETECTED),
+    ({24: 3, 25: 3}, 2,
+     PatternResult(detected=True, recent_phases=[24, 25], max_pass_count=3)),
+    # A clean phase after the run resets the pattern.
+    ({24: 3, 25: 3, 26: 1}, 2, _NOT_DETECTED),
+    ({24: 1}, 2, _NOT_DETECTED),
+    # B18 is CROSS-phase; a single phase with many passes does not fire.
+    ({24: 5}, 2, _NOT_DETECTED),
+    # window=3 needs three consecutive multi-pass phases, not two.
+    ({24: 3, 25: 3}, 3, _NOT_DETECTED),
+    ({24: 3, 25: 3, 26: 2}, 3,
+     PatternResult(detected=True, recent_phases=[24, 25, 26], max_pass_count=3)),
+], ids=[
+    "no-pattern",
+    "two-consecutive-multi-pass",
+    "resets-after-clean-phase",
+    "single-sealed-phase",
+    "one-phase-many-passes",
+    "window-3-two-consecutive",
+    "window-3-three-consecutive",
+])
+def test_detect_repeated_veto_pattern(counts, window, expected):
+    assert detect_repeated_veto_pattern(counts, window=window) == expected
 
 
 def test_pattern_result_namedtuple_shape():
-    from qor.scripts.veto_pattern import PatternResult
     r = PatternResult(detected=True, recent_phases=[1, 2], max_pass_count=3)
     assert r.detected is True
     assert r.recent_phases == [1, 2]
@@ -84,7 +67,6 @@ def test_pattern_result_namedtuple_shape():
 
 def test_parse_ignores_non_audit_entries_in_counts():
     """IMPLEMENT, REFACTOR, SEAL entries should not count as audit passes."""
-    from qor.scripts.veto_pattern import parse_phase_audit_counts
     text = """
 ### Entry #1: AUDIT -- Phase 5 plan review
 **Verdict**: PASS
@@ -104,7 +86,6 @@ def test_parse_ignores_non_audit_entries_in_counts():
 
 def test_parse_skips_unsealed_phase():
     """A phase without a SEAL entry should not appear in counts (in-flight work)."""
-    from qor.scripts.veto_pattern import parse_phase_audit_counts
     text = """
 ### Entry #1: AUDIT -- Phase 5 plan review
 **Verdict**: PASS